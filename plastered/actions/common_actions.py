@@ -10,7 +10,6 @@ from plastered.db.db_models import ScraperRunStatus
 from plastered.db.db_utils import create_scraper_run, update_scraper_run
 from plastered.models import EntityType
 from plastered.release_search.release_searcher import ReleaseSearcher
-from plastered.scraper.lfm_scraper import LFMRecsScraper
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -31,6 +30,9 @@ def run_lfm_scraper(
     then search/snatch each rec, updating the run's live progress (stage + processed/total recs) as it goes. Marks the
     run COMPLETED on success or FAILED (with the error) on any exception.
     """
+    # Function-scoped import: the scraper drags in bs4 + playwright, which only a scraper run needs.
+    from plastered.scraper.lfm_scraper import LFMRecsScraper
+
     try:
         update_scraper_run(run_id=run_id, stage="scraping")
         with LFMRecsScraper(
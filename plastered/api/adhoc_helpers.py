@@ -86,7 +86,7 @@ def schedule_adhoc_search(
     add_record(session=session, model_inst=record)
     if (search_id := record.id) is None:  # pragma: no cover
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unable to create search record")
-    _LOGGER.debug(f"Scheduling ad-hoc search id={search_id} for {req.search.artist!r} / {req.search.entity_type}")
+    _LOGGER.debug("Scheduling ad-hoc search id=%s for %r / %s", search_id, req.search.artist, req.search.entity_type)
     background_tasks.add_task(
         func=adhoc_search_action,
         release_searcher=release_searcher,
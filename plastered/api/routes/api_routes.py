@@ -39,7 +39,7 @@ async def healthcheck_endpoint(request: Request) -> JSONResponse:
 async def show_config_endpoint(request: Request, sub_conf: str | None = None) -> JSONResponse | HTMLResponse:
     _LOGGER.debug(f"/api/config endpoint called at {datetime.now(tz=UTC).timestamp()}")
     conf_dict = show_config_action(app_settings=request.state.lifespan_singleton.app_settings)
-    _LOGGER.debug(f"/api/config endpoint acquired conf_dict of size {len(conf_dict)}.")
+    _LOGGER.debug("/api/config endpoint acquired conf_dict of size %d.", len(conf_dict))
     if request.headers.get("HX-Request") == "true":
         _LOGGER.debug("/api/config endpoint detected request from HTMX.")
         if sub_conf:
@@ -120,7 +120,10 @@ async def adhoc_snatch_endpoint(session: SessionDep, request: Request, search_id
 async def scrape_endpoint(
     request: Request, session: SessionDep, snatch: bool = False, rec_type: EntityType | None = None
 ) -> RedirectResponse:
-    scrape_action(
+    # The scrape + search/snatch run is entirely blocking (browser, throttled API calls, DB and .torrent file writes), so
+    # dispatch it to a worker thread rather than running it inline on the event loop.
+    await run_in_threadpool(
+        scrape_action,
         app_settings=request.state.lifespan_singleton.app_settings,
         rec_types_to_scrape_override=[rec_type] if rec_type is not None else [et for et in EntityType],
         snatch_override=snatch,
@@ -323,7 +323,7 @@ async def user_details_page(request: Request) -> HTMLResponse:
 # /result_modal?<final-state-specific query parameters created by HTMX>
 @plastered_web_router.get("/result_modal")
 async def result_modal(request: Request) -> HTMLResponse:
-    _LOGGER.debug(f"endpoint /result_modal called with params: {request.query_params}")
+    _LOGGER.debug("endpoint /result_modal called with params: %s", request.query_params)
     return TEMPLATES.TemplateResponse(
         request=request, name="fragments/result_modal.html", context={"params": request.query_params}
     )
@@ -75,8 +75,8 @@ class SearchRecord(SQLModel, table=True):
     def from_search_item(cls, si: SearchItem) -> Self:
         return cls(
             is_manual=si.is_manual,
-            artist=si.initial_info.get_human_readable_artist_str(),
-            entity=si.initial_info.get_human_readable_entity_str(),
+            artist=si.artist_name,
+            entity=si.entity_name,
             submit_timestamp=int(datetime.now(tz=UTC).timestamp()),
             entity_type=si.initial_info.entity_type,
             status=Status.IN_PROGRESS,
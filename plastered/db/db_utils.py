@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import logging
 import os
-from typing import Any, Final
+from typing import TYPE_CHECKING, Any, Final
 
 from sqlmodel import Session, SQLModel, select
 
@@ -23,8 +23,18 @@ from plastered.db.db_models import (
 from plastered.models.types import EncodingEnum, EntityType, FormatEnum, MediaEnum
 from plastered.utils.exceptions import MissingDatabaseRecordException
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
 _LOGGER = logging.getLogger(__name__)
 _DB_TEST_MODE: Final[bool] = os.getenv("DB_TEST_MODE", "false").lower() == "true"
+# Status -> (status table model, name of its SearchRecord FK field), resolved once at import rather than per row.
+_STATUS_MODELS: Final[dict[Status, tuple[type[Failed | Grabbed | Skipped | Matched], str]]] = {
+    Status.FAILED: (Failed, "f_result_id"),
+    Status.GRABBED: (Grabbed, "g_result_id"),
+    Status.SKIPPED: (Skipped, "s_result_id"),
+    Status.MATCHED: (Matched, "m_result_id"),
+}
 
 
 def db_startup() -> None:
@@ -65,32 +75,45 @@ def set_result_status(search_id: int | None, status: Status, status_model_kwargs
     Takes in the given `SearchRecord` ID, updates the corresponding record's `status`, and creates a corresponding row in the
     associated status table. status_row_kwargs is a dict of kwargs for the status ORM instance.
     """
-    if search_id is None:
-        raise MissingDatabaseRecordException(search_id)
+    set_result_statuses(search_ids=[search_id], status=status, status_model_kwargs=status_model_kwargs)
+
+
+def set_result_statuses(search_ids: Sequence[int | None], status: Status, status_model_kwargs: dict[str, Any]) -> None:
+    """
+    Batched `set_result_status`: applies the same `status` and status-row kwargs to every given `SearchRecord` ID in a
+    single session and commit, rather than one round trip per record.
+    """
+    set_result_status_rows(status=status, rows=[(search_id, status_model_kwargs) for search_id in search_ids])
+
+
+def set_result_status_rows(status: Status, rows: Sequence[tuple[int | None, dict[str, Any]]]) -> None:
+    """
+    Like `set_result_statuses`, but each `(search_id, status_model_kwargs)` row carries its own status-row kwargs (e.g.
+    the per-record match details of `MATCHED` rows). All rows are written in a single session and commit.
+    """
+    if any(search_id is None for search_id, _ in rows):
+        raise MissingDatabaseRecordException(None)
     with Session(get_engine()) as session:
-        _LOGGER.debug("Querying SearchRecord record ...")
-        result_record = get_result_by_id(search_id=search_id, session=session)
-        _LOGGER.debug(f"Updating status of SearchRecord record (id={search_id}) ...")
-        result_record.status = status
-        session.add(result_record)
-        _LOGGER.debug(f"Creating associated Status record for SearchRecord record (id={search_id}) ...")
-        status_record: Failed | Grabbed | Skipped | Matched | None = None
-        if status == status.FAILED:
-            status_record = Failed(f_result_id=search_id, **status_model_kwargs)
-        elif status == status.GRABBED:
-            status_record = Grabbed(g_result_id=search_id, **status_model_kwargs)
-        elif status == status.SKIPPED:
-            status_record = Skipped(s_result_id=search_id, **status_model_kwargs)
-        elif status == status.MATCHED:
-            status_record = Matched(m_result_id=search_id, **status_model_kwargs)
-        else:
-            raise ValueError(  # pragma: no cover
-                f"Unexpected status: '{str(status)}'. Should be one of "
-                f"{[Status.FAILED, Status.GRABBED, Status.SKIPPED, Status.MATCHED]}"
-            )
-        session.add(status_record)
+        for search_id, status_model_kwargs in rows:
+            _LOGGER.debug("Querying SearchRecord record ...")
+            result_record = get_result_by_id(search_id=search_id, session=session)
+            _LOGGER.debug("Updating status of SearchRecord record (id=%s) ...", search_id)
+            result_record.status = status
+            session.add(result_record)
+            _LOGGER.debug("Creating associated Status record for SearchRecord record (id=%s) ...", search_id)
+            session.add(_new_status_record(search_id=search_id, status=status, status_model_kwargs=status_model_kwargs))
         session.commit()
-        _LOGGER.debug(f"Finished updating status of SearchRecord record (id={search_id}) ...")
+        _LOGGER.debug("Finished updating status of %d SearchRecord records.", len(rows))
+
+
+def _new_status_record(
+    search_id: int | None, status: Status, status_model_kwargs: dict[str, Any]
+) -> Failed | Grabbed | Skipped | Matched:
+    try:
+        status_model, fk_field = _STATUS_MODELS[status]
+    except KeyError:  # pragma: no cover
+        raise ValueError(f"Unexpected status: '{str(status)}'. Should be one of {list(_STATUS_MODELS)}") from None
+    return status_model(**{fk_field: search_id}, **status_model_kwargs)
 
 
 def create_scraper_run(snatch_enabled: bool, rec_types: list[str], submit_timestamp: int) -> int:
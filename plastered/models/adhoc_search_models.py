@@ -12,7 +12,6 @@ RED browse query.
 both the scraper flow (`LFMRec`) and the ad-hoc flow without branching.
 """
 
-from collections import OrderedDict
 from datetime import datetime
 from typing import Any, Self
 from urllib.parse import quote_plus
@@ -80,7 +79,7 @@ class AdhocSearch(BaseModel):
 
     @property
     def lfm_entity_url(self) -> str:
-        if self.entity_type == EntityType.ALBUM:
+        if self.entity_type is EntityType.ALBUM:
             return f"https://www.last.fm/music/{self.encoded_artist_str}/{self.encoded_entity_str}"
         return f"https://www.last.fm/music/{self.encoded_artist_str}/_/{self.encoded_entity_str}"
 
@@ -96,16 +95,16 @@ class AdhocSearch(BaseModel):
         return self._entity
 
     def get_human_readable_track_str(self) -> str:
-        if self.entity_type != EntityType.TRACK:
+        if self.entity_type is not EntityType.TRACK:
             raise ValueError("Cannot get track name from an album ad-hoc search.")
         return self._entity
 
-    def get_user_search_kwargs(self) -> OrderedDict[str, Any]:
+    def get_user_search_kwargs(self) -> dict[str, Any]:
         """
         Returns the user-supplied optional RED browse params (URL-encoded where needed), omitting any unset fields.
         These take precedence over any values later resolved from MusicBrainz (see `SearchItem.set_mb_release`).
         """
-        kwargs: OrderedDict[str, Any] = OrderedDict()
+        kwargs: dict[str, Any] = {}
         if self.release_type is not None:
             kwargs[RED_PARAM_RELEASE_TYPE] = self.release_type.value
         if self.release_year is not None:
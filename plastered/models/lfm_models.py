@@ -94,6 +94,8 @@ class LFMRec:
     Corresponds to either a distinct LFM Album recommendation, or a distinct LFM Track recommendation.
     """
 
+    __slots__ = ("_lfm_artist_str", "_lfm_entity_str", "_entity_type", "_rec_context")
+
     def __init__(
         self,
         lfm_artist_str: str,
@@ -103,8 +105,22 @@ class LFMRec:
     ):
         self._lfm_artist_str = lfm_artist_str
         self._lfm_entity_str = lfm_entity_str
-        self._entity_type = EntityType(recommendation_type)
-        self._rec_context = RecContext(rec_context)
+        # The scraper and the RunCache unpickling path already pass enum members, so only coerce raw string values.
+        self._entity_type = (
+            recommendation_type if isinstance(recommendation_type, EntityType) else EntityType(recommendation_type)
+        )
+        self._rec_context = rec_context if isinstance(rec_context, RecContext) else RecContext(rec_context)
+
+    def __reduce__(self) -> tuple[type["LFMRec"], tuple[str, str, EntityType, RecContext]]:
+        # Scraped recs are pickled into the scraper RunCache. Pickling each rec as its constructor args keeps the payload
+        # to 4 fields per rec, rather than a per-instance `__dict__` state keyed by attribute name.
+        return (LFMRec, (self._lfm_artist_str, self._lfm_entity_str, self._entity_type, self._rec_context))
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        # Rec lists cached before `__reduce__` was defined were pickled with a `__dict__` state; restore them into the
+        # slots so those cache entries still load.
+        for attr_name, value in state.items():
+            setattr(self, attr_name, value)
 
     def __str__(self) -> str:
         return f"artist={self._lfm_artist_str}, {self._entity_type.value}={self._lfm_entity_str}, context={self._rec_context.value}"
@@ -116,14 +132,14 @@ class LFMRec:
             self.encoded_artist_str == other.encoded_artist_str
             and self.encoded_entity_str == other.encoded_entity_str
             and self.is_album_rec() == other.is_album_rec()
-            and self.rec_context.value == other.rec_context.value
+            and self.rec_context is other.rec_context
         )
 
     def is_album_rec(self) -> bool:
-        return self._entity_type == EntityType.ALBUM
+        return self._entity_type is EntityType.ALBUM
 
     def is_track_rec(self) -> bool:
-        return self._entity_type == EntityType.TRACK
+        return self._entity_type is EntityType.TRACK
 
     @property
     def encoded_artist_str(self) -> str:
@@ -156,6 +172,6 @@ class LFMRec:
 
     @property
     def lfm_entity_url(self) -> str:
-        if self._entity_type == EntityType.ALBUM:
+        if self._entity_type is EntityType.ALBUM:
             return f"https://www.last.fm/music/{self._lfm_artist_str}/{self._lfm_entity_str}"
         return f"https://www.last.fm/music/{self._lfm_artist_str}/_/{self._lfm_entity_str}"
@@ -1,5 +1,4 @@
 import re
-from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Any
 from urllib.parse import quote_plus
@@ -63,20 +62,15 @@ class MBRelease:
         except KeyError:
             return RedReleaseType.UNKNOWN
 
-    def get_release_searcher_kwargs(self) -> OrderedDict[str, Any]:
+    def get_release_searcher_kwargs(self) -> dict[str, Any]:
         """Helper method to return the search_kwargs used by the ReleaseSearcher on the RED browse endpoint."""
-        return OrderedDict(
-            [
-                (RED_PARAM_RELEASE_TYPE, self.get_red_release_type().value),
-                (
-                    RED_PARAM_RELEASE_YEAR,
-                    (
-                        self.first_release_year
-                        if (self.first_release_year is not None and self.first_release_year > 0)
-                        else None
-                    ),
-                ),
-                (RED_PARAM_RECORD_LABEL, quote_plus(self.label) if self.label else None),
-                (RED_PARAM_CATALOG_NUMBER, quote_plus(self.catalog_number) if self.catalog_number else None),
-            ]
-        )
+        return {
+            RED_PARAM_RELEASE_TYPE: self.get_red_release_type().value,
+            RED_PARAM_RELEASE_YEAR: (
+                self.first_release_year
+                if (self.first_release_year is not None and self.first_release_year > 0)
+                else None
+            ),
+            RED_PARAM_RECORD_LABEL: quote_plus(self.label) if self.label else None,
+            RED_PARAM_CATALOG_NUMBER: quote_plus(self.catalog_number) if self.catalog_number else None,
+        }
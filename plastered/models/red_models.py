@@ -70,6 +70,11 @@ class RedFormat(BaseModel):
     def _coerce_media_str_to_enum(cls, raw_value: str) -> MediaEnum:
         return MediaEnum(raw_value) if isinstance(raw_value, str) else raw_value
 
+    @property
+    def match_key(self) -> tuple[FormatEnum, EncodingEnum, MediaEnum]:
+        """The (format, encoding, media) triple torrents are ranked by against the configured format preferences."""
+        return (self.format, self.encoding, self.media)
+
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, RedFormat):
             return False
@@ -174,6 +179,11 @@ class TorrentEntry:
             return float(self.size) / BYTES_IN_MB
         return float(self.size) / BYTES_IN_GB
 
+    @property
+    def size_gb(self) -> float:
+        """The torrent's size in GB."""
+        return float(self.size) / BYTES_IN_GB
+
     def get_permalink_url(self) -> str:
         return f"https://redacted.sh/torrents.php?torrentid={self.torrent_id}"
 
@@ -286,8 +296,8 @@ class RedUserDetails(BaseModel):
         return snatched_dict
 
     @cached_property
-    def _snatched_tids(self) -> set[int]:
-        return set([int(json_entry["torrentId"]) for json_entry in self.snatched_torrents_list])
+    def _snatched_tids(self) -> frozenset[int]:
+        return frozenset(int(json_entry["torrentId"]) for json_entry in self.snatched_torrents_list)
 
     @property
     def has_fl_tokens(self) -> bool:
@@ -297,21 +307,20 @@ class RedUserDetails(BaseModel):
         self.available_fl_tokens -= 1
         _LOGGER.info(f"Used an FL token. Approximate remaining tokens: {self.available_fl_tokens}")
 
-    # This method specifically is for pre-RED search filtering of the LFM recs, since the LFM recs do not yet have a potential TID associated with them.
-    def has_snatched_release(self, artist: str, release: str) -> bool:
+    def snatched_release_pairs(self) -> frozenset[tuple[str, str]]:
         """
-        Searches whether the release was already listed in the user's snatched torrents.
-        NOTE: 'artist' and 'album' must be the human-readable, non URL-encoded strings.
+        Returns a snapshot of the user's snatched releases as lower-cased `(artist, release)` pairs. Taken once per run
+        by the `SearchState` so the per-rec prior-snatch check is a single set-membership test.
+        NOTE: the pairs are the human-readable, non URL-encoded strings, so lookups must use the same.
         """
-        return (artist.lower(), release.lower()) in self._snatched_torrents_dict
+        return frozenset(self._snatched_torrents_dict)
 
-    # This method is for specifically pre-snatch filtering of matched RED releases.
-    def has_snatched_tid(self, tid: int) -> bool:
+    def snatched_tids(self) -> frozenset[int]:
         """
-        Returns True if the provided tid is already in the user's snatched / seeding torrents list.
-        Returns False otherwise.
+        Returns the user's snatched / seeding torrent IDs. Taken once per run by the `SearchState`, alongside
+        `snatched_release_pairs`.
         """
-        return tid in self._snatched_tids
+        return self._snatched_tids
 
     def calculate_max_download_allowed_gb(self, min_allowed_ratio: float) -> float:
         """
@@ -1,18 +1,19 @@
-from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import Any
+from urllib.parse import quote_plus
 
 from plastered.models.adhoc_search_models import AdhocSearch
 from plastered.models.lfm_models import LFMAlbumInfo, LFMRec, LFMTrackInfo
 from plastered.models.musicbrainz_models import MBRelease
 from plastered.models.red_models import TorrentEntry, TorrentMatch
 from plastered.models.types import EntityType
+from plastered.utils.exceptions import MissingTorrentEntryException
 
 type InitialInfo = LFMRec | AdhocSearch
 
 
 # TODO [later]: Consolidate the `SearchRecord` db model and `SearchItem` into a single class.
-@dataclass
+@dataclass(slots=True)
 class SearchItem:
     """
     Class which represents the full range of possible information that may be associated with an LFMRec over the
@@ -28,7 +29,10 @@ class SearchItem:
     _lfm_album_info: LFMAlbumInfo | None = None
     _lfm_track_info: LFMTrackInfo | None = None
     _mb_release: MBRelease | None = None
-    _search_kwargs: OrderedDict[str, Any] = field(default_factory=OrderedDict)
+    _search_kwargs: dict[str, Any] = field(default_factory=dict)
+    _artist_name: str = field(init=False, repr=False, compare=False)
+    _entity_name: str = field(init=False, repr=False, compare=False)
+    _encoded_release_name: tuple[str, str] | None = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """
@@ -37,8 +41,12 @@ class SearchItem:
         LFMTi resolution (see `ReleaseSearcher._resolve__resolve_lfm_track_info` and `SearchItem.set_lfm_track_info`).
         For more on dataclasses and __post_init__ method, see this SO answer: https://stackoverflow.com/a/76187691
         """
-        if self.initial_info.entity_type == EntityType.ALBUM.value:
-            self.release_name = self.initial_info.get_human_readable_entity_str()
+        # The human-readable names are read repeatedly by the filters, log lines and DB rows over a rec's lifetime, so
+        # resolve (i.e. URL-unquote) them once here rather than on every access.
+        self._artist_name = self.initial_info.get_human_readable_artist_str()
+        self._entity_name = self.initial_info.get_human_readable_entity_str()
+        if self.initial_info.entity_type is EntityType.ALBUM:
+            self.release_name = self._entity_name
         else:
             self.release_name = "None" if not self._lfm_track_info else self._lfm_track_info.release_name
         # Ad-hoc searches may carry user-supplied optional RED browse params; seed them up-front so they are used even
@@ -49,11 +57,31 @@ class SearchItem:
     @property
     def artist_name(self) -> str:
         """Returns the human-readable artist name."""
-        return self.initial_info.get_human_readable_artist_str()
+        return self._artist_name
+
+    @property
+    def entity_name(self) -> str:
+        """Returns the human-readable name of the rec'd entity (the album name, or the track name for a track)."""
+        return self._entity_name
+
+    @property
+    def encoded_release_name(self) -> str:
+        """
+        Returns the URL-encoded `release_name`. Memoized alongside the `release_name` it was encoded from, since that
+        may be re-assigned later in the run (see `set_lfm_track_info`).
+        """
+        cached = self._encoded_release_name
+        if cached is None or cached[0] != self.release_name:
+            cached = self._encoded_release_name = (self.release_name, quote_plus(self.release_name))
+        return cached[1]
 
     @property
     def track_name(self) -> str:
         """Returns the human-readable track name."""
+        # For a track search the rec'd entity is the track, so reuse the name resolved at construction. Album searches
+        # still delegate, so they raise exactly as `get_human_readable_track_str` does.
+        if self.initial_info.entity_type is EntityType.TRACK:
+            return self._entity_name
         return self.initial_info.get_human_readable_track_str()
 
     @property
@@ -61,26 +89,34 @@ class SearchItem:
         """Returns `True` if the SearchItem is an ad-hoc (non-scraper) search, otherwise `False` for an LFMRec."""
         return isinstance(self.initial_info, AdhocSearch)
 
-    def get_search_kwargs(self) -> OrderedDict[str, Any]:
+    @property
+    def size_gb(self) -> float:
+        """Returns the matched torrent's size in GB."""
+        if not self.torrent_entry:
+            raise MissingTorrentEntryException("SearchItem missing torrent entry")
+        return self.torrent_entry.size_gb
+
+    def get_search_kwargs(self) -> dict[str, Any]:
         return self._search_kwargs
 
-    def search_kwargs_has_all_required_fields(self, required_kwargs: set[str]) -> bool:
+    def search_kwargs_has_all_required_fields(self, required_kwargs: frozenset[str]) -> bool:
         """
         Return `True` if all the specified fields are set to non-empty values.
         Return `False` otherwise.
         """
-        if not required_kwargs.issubset(set(self._search_kwargs.keys())):
+        search_kwargs = self._search_kwargs
+        if not required_kwargs.issubset(search_kwargs):
             return False
-        return all([self._search_kwargs[k] is not None for k in required_kwargs])
+        return all(search_kwargs[k] is not None for k in required_kwargs)
 
     def get_matched_mbid(self) -> str | None:
         # An ad-hoc search may directly supply the release MBID; prefer it, otherwise fall through to any MBID resolved
         # from the LFM album/track info (the latter applies to ad-hoc track searches, which still resolve a release).
         if isinstance(self.initial_info, AdhocSearch) and self.initial_info.mbid is not None:
             return self.initial_info.mbid
-        if self.initial_info.entity_type == EntityType.ALBUM and self._lfm_album_info is not None:
+        if self.initial_info.entity_type is EntityType.ALBUM and self._lfm_album_info is not None:
             return self._lfm_album_info.release_mbid
-        elif self.initial_info.entity_type == EntityType.TRACK and self._lfm_track_info is not None:
+        elif self.initial_info.entity_type is EntityType.TRACK and self._lfm_track_info is not None:
             return self._lfm_track_info.release_mbid
         return None
 
@@ -25,8 +25,9 @@ class SearchItemModifier(ABC):
     ) -> SearchItem: ...
 
 
-# Type defs for reduced boilerplate
-type FilterFuncs = tuple[Callable[[SearchItem, SearchState], SkipReason | None], ...]
+# Type defs for reduced boilerplate. Filter funcs take `(state, si)` so the `SearchState` rule methods can be listed
+# directly (as unbound methods) rather than wrapped in per-rule lambdas.
+type FilterFuncs = tuple[Callable[[SearchState, SearchItem], SkipReason | None], ...]
 
 
 class SearchItemFilter(ABC):
@@ -8,11 +8,11 @@ from typing import TYPE_CHECKING, Any, ClassVar
 from plastered.db.db_models import SkipReason, Status
 from plastered.db.db_utils import set_result_status
 from plastered.release_search.processors.bases import SearchItemFilter
+from plastered.release_search.search_helpers import SearchState
 
 if TYPE_CHECKING:
     from plastered.models import SearchItem
     from plastered.release_search.processors.bases import FilterFuncs
-    from plastered.release_search.search_helpers import SearchState
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -23,17 +23,17 @@ class BaseFilter(SearchItemFilter):
     @classmethod
     def process(cls, si: SearchItem, state: SearchState, **kwargs: Any) -> SearchItem | None:
         for func in cls.funcs:
-            if skip_reason := func(si, state):
+            if skip_reason := func(state, si):
                 cls._mark_skipped(si=si, skip_reason=skip_reason)
-                _LOGGER.debug(f"Skipped snatch:\n{skip_reason=}\n{si=}")
+                _LOGGER.debug("Skipped snatch:\nskip_reason=%r\nsi=%r", skip_reason, si)
                 return None
-        _LOGGER.debug(f"{si.initial_info} passed all {cls.__name__} filters.")
+        _LOGGER.debug("%s passed all %s filters.", si.initial_info, cls.__name__)
         return si
 
     @classmethod
     def _mark_skipped(cls, si: SearchItem, skip_reason: SkipReason) -> None:
         """Adds a Skipped db record for the given `SearchItem` and `SkipReason`."""
-        _LOGGER.debug(f"{si.initial_info} filtered by {cls.__name__} for reason {skip_reason.name}.")
+        _LOGGER.debug("%s filtered by %s for reason %s.", si.initial_info, cls.__name__, skip_reason.name)
         set_result_status(
             search_id=si.search_id, status=Status.SKIPPED, status_model_kwargs={"skip_reason": skip_reason}
         )
@@ -42,11 +42,9 @@ class BaseFilter(SearchItemFilter):
 class PreMBIDResolutionFilter(BaseFilter):
     """Intended as a replacement for `SearchState.pre_mbid_resolution_filter`."""
 
+    # The rec-context rule is a pure attribute compare, so it runs ahead of the snatch-history lookup.
     funcs: ClassVar[FilterFuncs] = tuple(
-        [
-            lambda si, state: state._pre_mbid_reso_rule_not_previously_snatched(si=si),
-            lambda si, state: state._pre_mbid_reso_rule_allowed_rec_context(si=si),
-        ]
+        [SearchState._pre_mbid_reso_rule_allowed_rec_context, SearchState._pre_mbid_reso_rule_not_previously_snatched]
     )
 
 
@@ -54,14 +52,14 @@ class PostResolveOriginTrackFilter(BaseFilter):
     """Intended as a replacement for `SearchState.post_resolve_track_filter`."""
 
     funcs: ClassVar[FilterFuncs] = tuple(
-        [lambda si, _: None if si._lfm_track_info else SkipReason.NO_SOURCE_RELEASE_FOUND]
+        [lambda _, si: None if si._lfm_track_info else SkipReason.NO_SOURCE_RELEASE_FOUND]
     )
 
 
 class PostMBIDResolutionFilter(BaseFilter):
     """Intended as a replacement for `SearchState.post_mbid_resolution_filter`."""
 
-    funcs: ClassVar[FilterFuncs] = tuple([lambda si, state: state.post_mbid_reso_rule_has_required_fields(si=si)])
+    funcs: ClassVar[FilterFuncs] = tuple([SearchState.post_mbid_reso_rule_has_required_fields])
 
 
 class PostRedSearchFilter(BaseFilter):
@@ -69,8 +67,8 @@ class PostRedSearchFilter(BaseFilter):
 
     funcs: ClassVar[FilterFuncs] = tuple(
         [
-            lambda si, state: state.post_red_search_rule_found_match_with_allowed_size(si=si),
-            lambda si, state: state._post_red_search_rule_not_dupe_snatch(si=si),
-            lambda si, state: state.add_search_item_to_snatch(si=si),
+            SearchState.post_red_search_rule_found_match_with_allowed_size,
+            SearchState._post_red_search_rule_not_prior_snatch,
+            SearchState.add_search_item_to_snatch,
         ]
     )
@@ -31,7 +31,7 @@ class ResolveAlbumInfoModifier(SearchItemModifier):
         try:
             lfmai = LFMAlbumInfo.construct_from_api_response(json_blob=lfm.get_album_info(si=si))
         except LFMClientException as ex:  # pragma: no cover
-            _LOGGER.debug(f"{ex.__class__.__name__} during LFM album info resolution for search item: {si}")
+            _LOGGER.debug("%s during LFM album info resolution for search item: %s", ex.__class__.__name__, si)
             lfmai = None
         si.set_lfm_album_info(lfmai=lfmai)
         return si
@@ -51,7 +51,7 @@ class ResolveTrackInfoModifier(SearchItemModifier):
                 return si
         except (LFMClientException, KeyError, TypeError) as ex:
             # KeyError/TypeError guard against a malformed LFM `album` blob; fall through to MusicBrainz resolution.
-            _LOGGER.debug(f"{ex.__class__.__name__} during track origin release resolution: {si}")
+            _LOGGER.debug("%s during track origin release resolution: %s", ex.__class__.__name__, si)
         artist_mbid = None
         if isinstance(lfm_resp, dict) and isinstance(lfm_resp.get("artist"), dict):
             artist_mbid = lfm_resp["artist"].get("mbid")
@@ -91,7 +91,7 @@ class AttemptResolveMBReleaseModifier(SearchItemModifier):
             _LOGGER.debug("MusicBrainz release resolution not required by config; skipping the lookup.")
             return si
         if not (mbid := si.get_matched_mbid()):
-            _LOGGER.debug(f"No MBID to resolve from for artist: '{si.artist_name}', release: '{si.release_name}'")
+            _LOGGER.debug("No MBID to resolve from for artist: '%s', release: '%s'", si.artist_name, si.release_name)
             return si
         try:
             si.set_mb_release(MBRelease.construct_from_api(json_blob=mb.request_release_details(mbid=mbid)))
@@ -118,6 +118,6 @@ class SearchRedReleaseByPrefsModifier(SearchItemModifier):
             release_entries = []
         torrent_match = state.select_best_torrent(release_entries=release_entries)
         if torrent_match.torrent_entry is None:
-            _LOGGER.debug(f"No torrent match found for si: {si.initial_info}")
+            _LOGGER.debug("No torrent match found for si: %s", si.initial_info)
         si.set_torrent_match_fields(torrent_match=torrent_match)
         return si
@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING
 
 from plastered.db.db_models import FailReason, Status
 from plastered.db.db_utils import set_result_status
-from plastered.models import AdhocSearch, EntityType, LFMRec, RedUserDetails, SearchItem
+from plastered.models import AdhocSearch, EntityType, LFMRec, RecContext, RedUserDetails, SearchItem
 from plastered.release_search.processors import SearchItemProcessorChain
 from plastered.release_search.search_helpers import SearchState
 from plastered.snatch import Snatcher
@@ -30,12 +30,12 @@ def _dedupe_recs(recs: list[LFMRec]) -> list[LFMRec]:
     recorded as a separate `SearchRecord` — more than once. Recs are deduped by the same identity as `LFMRec.__eq__`
     (artist, entity, album-vs-track, rec context).
     """
-    seen: set[tuple[str, str, bool, str]] = set()
+    seen: set[tuple[str, str, bool, RecContext]] = set()
     deduped: list[LFMRec] = []
     for rec in recs:
-        key = (rec.encoded_artist_str, rec.encoded_entity_str, rec.is_album_rec(), rec.rec_context.value)
+        key = (rec.encoded_artist_str, rec.encoded_entity_str, rec.is_album_rec(), rec.rec_context)
         if key in seen:
-            _LOGGER.debug(f"Dropping duplicate rec: {rec}")
+            _LOGGER.debug("Dropping duplicate rec: %s", rec)
             continue
         seen.add(key)
         deduped.append(rec)
@@ -144,7 +144,7 @@ class ReleaseSearcher:
             raise ReleaseSearcherException(f"Matched result for search_id={search_id} has no tid to snatch.")
         out_filepath = Path(os.path.join(self._app_settings.red.snatches.snatch_directory, f"{matched.tid}.torrent"))
         exc_name: str | None = None
-        _LOGGER.debug(f"Snatching recorded match tid={matched.tid} to {out_filepath} ...")
+        _LOGGER.debug("Snatching recorded match tid=%s to %s ...", matched.tid, out_filepath)
         try:
             binary_contents = self._red_snatch_client.snatch(tid=str(matched.tid), can_use_token=False)
             out_filepath.write_bytes(binary_contents)
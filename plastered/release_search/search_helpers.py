@@ -1,10 +1,22 @@
 import logging
-from urllib.parse import quote_plus
+from itertools import chain
+from operator import itemgetter
+from typing import Any
 
-from plastered.config.app_settings import AppSettings, FormatPreference
+from plastered.config.app_settings import AppSettings
 from plastered.db.db_models import FailReason, SkipReason, Status
-from plastered.db.db_utils import set_result_status
-from plastered.models import RecContext, RedUserDetails, ReleaseEntry, SearchItem, TorrentEntry, TorrentMatch
+from plastered.db.db_utils import set_result_status, set_result_status_rows, set_result_statuses
+from plastered.models import (
+    EncodingEnum,
+    FormatEnum,
+    MediaEnum,
+    RecContext,
+    RedUserDetails,
+    ReleaseEntry,
+    SearchItem,
+    TorrentEntry,
+    TorrentMatch,
+)
 from plastered.utils.constants import (
     OPTIONAL_RED_PARAMS,
     RED_BROWSE_CONSTANT_PARAMS,
@@ -18,48 +30,66 @@ from plastered.utils.exceptions import MissingTorrentEntryException, SearchItemE
 _LOGGER = logging.getLogger(__name__)
 
 
-def _required_search_kwargs(
-    use_release_type: bool, use_first_release_year: bool, use_record_label: bool, use_catalog_number: bool
-) -> set[str]:
-    required_kwargs = set()
-    if use_release_type:
-        required_kwargs.add(RED_PARAM_RELEASE_TYPE)
-    if use_first_release_year:
-        required_kwargs.add(RED_PARAM_RELEASE_YEAR)
-    if use_record_label:
-        required_kwargs.add(RED_PARAM_RECORD_LABEL)
-    if use_catalog_number:
-        required_kwargs.add(RED_PARAM_CATALOG_NUMBER)
-    return required_kwargs
-
-
 class SearchState:
     """
     Helper class which maintains the variable internal state of the searching process, and
     which handles the pre and post search filtering logic during a search run.
     """
 
+    # The rules below are evaluated once or more per rec, so keep the per-run state in slots rather than an instance dict.
+    __slots__ = (
+        "_skip_prior_snatches",
+        "_allow_library_items",
+        "_required_red_search_kwargs",
+        "_enabled_optional_red_params",
+        "_require_mbid_resolution",
+        "_format_pref_ranks",
+        "_max_size_gb",
+        "_min_allowed_ratio",
+        "_max_download_allowed_gb",
+        "_red_user_details",
+        "_snatched_release_pairs",
+        "_snatched_tids",
+        "_tids_to_snatch",
+        "_search_items_to_snatch",
+        "_manual_search_item_to_snatch",
+    )
+
     def __init__(self, app_settings: AppSettings, red_user_details: RedUserDetails | None = None):
         self._skip_prior_snatches = app_settings.red.snatches.skip_prior_snatches
         self._allow_library_items = app_settings.lfm.allow_library_items
-        self._use_release_type = app_settings.red.search.use_release_type
-        self._use_first_release_year = app_settings.red.search.use_first_release_year
-        self._use_record_label = app_settings.red.search.use_record_label
-        self._use_catalog_number = app_settings.red.search.use_catalog_number
-        self._required_red_search_kwargs: set[str] = _required_search_kwargs(
-            use_release_type=self._use_release_type,
-            use_first_release_year=self._use_first_release_year,
-            use_record_label=self._use_record_label,
-            use_catalog_number=self._use_catalog_number,
+        search_settings = app_settings.red.search
+        # Each optional RED browse param is required exactly when its `use_*` search setting is enabled. The enabled
+        # params are resolved once, in the RED-expected param order, so the scraper flow can append them per rec without
+        # re-checking every optional param.
+        param_enabled = {
+            RED_PARAM_RELEASE_TYPE: search_settings.use_release_type,
+            RED_PARAM_RELEASE_YEAR: search_settings.use_first_release_year,
+            RED_PARAM_RECORD_LABEL: search_settings.use_record_label,
+            RED_PARAM_CATALOG_NUMBER: search_settings.use_catalog_number,
+        }
+        self._enabled_optional_red_params: tuple[str, ...] = tuple(
+            red_param for red_param, enabled in param_enabled.items() if enabled
         )
+        self._required_red_search_kwargs = frozenset(self._enabled_optional_red_params)
         # MBID resolution is required exactly when at least one optional search field is enabled, i.e. the
         # required-kwargs set above is non-empty.
         self._require_mbid_resolution = bool(self._required_red_search_kwargs)
-        self._red_format_preferences = app_settings.get_red_format_preferences()
+        # Priority rank (0 = most preferred) of each configured format preference, keyed by its (format, encoding,
+        # media) match key, so a browse's torrents can be ranked in a single pass. A repeated preference keeps its
+        # highest priority.
+        self._format_pref_ranks: dict[tuple[FormatEnum, EncodingEnum, MediaEnum], int] = {}
+        for rank, pref in enumerate(app_settings.get_red_format_preferences()):
+            self._format_pref_ranks.setdefault(pref.match_key, rank)
         self._max_size_gb = app_settings.red.snatches.max_size_gb
         self._min_allowed_ratio = app_settings.red.snatches.min_allowed_ratio
         self._max_download_allowed_gb = 0.0
         self._red_user_details = red_user_details
+        # Only the prior-snatch rule reads the release pairs, so skip building the snapshot when that rule is disabled.
+        self._snatched_release_pairs: frozenset[tuple[str, str]] = (
+            red_user_details.snatched_release_pairs() if red_user_details and self._skip_prior_snatches else frozenset()
+        )
+        self._snatched_tids: frozenset[int] = red_user_details.snatched_tids() if red_user_details else frozenset()
         self._tids_to_snatch: set[int] = set()
         self._search_items_to_snatch: list[SearchItem] = []
         self._manual_search_item_to_snatch: SearchItem | None = None
@@ -76,6 +106,9 @@ class SearchState:
             min_allowed_ratio=self._min_allowed_ratio
         )
         self._red_user_details = red_user_details
+        if self._skip_prior_snatches:
+            self._snatched_release_pairs = red_user_details.snatched_release_pairs()
+        self._snatched_tids = red_user_details.snatched_tids()
 
     def create_red_browse_params(self, si: SearchItem) -> str:
         """
@@ -85,16 +118,17 @@ class SearchState:
         browse per format preference.
         """
         artist_name = si.initial_info.encoded_artist_str
-        album_name = quote_plus(si.release_name)
+        album_name = si.encoded_release_name
         # TODO: figure out why the `order_by` param appears to be ignored whenever the params also have `group_results=1`.
-        browse_request_params = f"artistname={artist_name}&groupname={album_name}&{RED_BROWSE_CONSTANT_PARAMS}"
-        for red_param in OPTIONAL_RED_PARAMS:
-            # For ad-hoc searches, include every optional param the request actually supplied (all such fields are
-            # optional in the ad-hoc flow). For the scraper flow, only include params enabled by `red.search`.
-            include_param = si.is_manual or red_param in self._required_red_search_kwargs
-            if include_param and (red_param_val := si.get_search_kwargs().get(red_param)):
-                browse_request_params += f"&{red_param}={red_param_val}"
-        return browse_request_params
+        param_parts = [f"artistname={artist_name}", f"groupname={album_name}", RED_BROWSE_CONSTANT_PARAMS]
+        # For ad-hoc searches, include every optional param the request actually supplied (all such fields are optional
+        # in the ad-hoc flow). For the scraper flow, only include params enabled by `red.search`.
+        red_params = OPTIONAL_RED_PARAMS if si.is_manual else self._enabled_optional_red_params
+        search_kwargs = si.get_search_kwargs()
+        for red_param in red_params:
+            if red_param_val := search_kwargs.get(red_param):
+                param_parts.append(f"{red_param}={red_param_val}")
+        return "&".join(param_parts)
 
     def mb_resolution_would_be_used(self, si: SearchItem) -> bool:
         """
@@ -110,11 +144,12 @@ class SearchState:
             msg = "Red User Details not initialized."
             _LOGGER.error(msg)
             raise SearchStateException(msg)
-        # Use `si.release_name`, not `initial_info.get_human_readable_entity_str()`: for a track the latter is the track
-        # name, whereas the prior-snatch dict is keyed by release name. `release_name` is the album name for albums and
-        # the resolved origin-release name for tracks (this filter runs after track resolution in the chain).
-        if self._skip_prior_snatches and self._red_user_details.has_snatched_release(
-            artist=si.artist_name, release=si.release_name
+        # Use `si.release_name`, not `si.entity_name`: for a track the latter is the track name, whereas the prior-snatch
+        # set is keyed by release name. `release_name` is the album name for albums and the resolved origin-release name
+        # for tracks (this filter runs after track resolution in the chain).
+        if (
+            self._skip_prior_snatches
+            and (si.artist_name.lower(), si.release_name.lower()) in self._snatched_release_pairs
         ):
             return SkipReason.ALREADY_SNATCHED
         return None
@@ -123,7 +158,7 @@ class SearchState:
         """
         Return `True` if si has an `IN_LIBRARY` context and self._allow_library items is `False`, return `False` otherwise.
         """
-        if not self._allow_library_items and si.initial_info.rec_context == RecContext.IN_LIBRARY:
+        if not self._allow_library_items and si.initial_info.rec_context is RecContext.IN_LIBRARY:
             return SkipReason.REC_CONTEXT_FILTERING
         return None
 
@@ -141,26 +176,28 @@ class SearchState:
             return SkipReason.UNRESOLVED_REQUIRED_SEARCH_FIELDS
         return None
 
-    def _post_red_search_rule_not_dupe_snatch(self, si: SearchItem) -> SkipReason | None:
+    def _post_red_search_rule_not_prior_snatch(self, si: SearchItem) -> SkipReason | None:
         """
-        Return `True` if si corresponds to an already to-be-snatched entry or to a past snatch.
+        Return `SkipReason.ALREADY_SNATCHED` if si's matched torrent is a past snatch. Dupes of another rec's pending
+        snatch are caught by `add_search_item_to_snatch`, where the pending-tid check and insert happen together.
         """
         if not self._red_user_details:
             raise SearchStateException("Red user details not initialized")
-        if not si.torrent_entry:
+        if not (te := si.torrent_entry):
             raise SearchItemException("SearchItem instance has not torrent_entry.")
-        # Ignore this condition for manual searches since those are not done in batch
-        if (not si.is_manual) and si.torrent_entry.torrent_id in self._tids_to_snatch:
-            return SkipReason.DUPE_OF_ANOTHER_REC
-        if self._red_user_details.has_snatched_tid(tid=si.torrent_entry.torrent_id):
+        if te.torrent_id in self._snatched_tids:
             return SkipReason.ALREADY_SNATCHED
         return None
 
     def post_red_search_rule_found_match_with_allowed_size(self, si: SearchItem) -> SkipReason | None:
         if not si.found_red_match():
-            _LOGGER.info(
-                f"No valid RED match found for {si.initial_info.entity_type}: '{si.initial_info.get_human_readable_entity_str()}' by '{si.artist_name}'"
-            )
+            if _LOGGER.isEnabledFor(logging.INFO):
+                _LOGGER.info(
+                    "No valid RED match found for %s: '%s' by '%s'",
+                    si.initial_info.entity_type,
+                    si.entity_name,
+                    si.artist_name,
+                )
             return SkipReason.ABOVE_MAX_ALLOWED_SIZE if si.above_max_size_te_found else SkipReason.NO_MATCH_FOUND
         return None
 
@@ -173,18 +210,25 @@ class SearchState:
         if exc_name:
             self._add_failed_snatch_row(si=si, exc_name=exc_name)
             return
-        if not si.torrent_entry:  # pragma: no cover
-            raise MissingTorrentEntryException("SearchItem missing torrent entry")
+        # `_add_grabbed_row` binds and checks the torrent entry itself.
         self._add_grabbed_row(si=si, snatch_path=snatch_path, snatched_with_fl=snatched_with_fl)
 
-    def add_search_item_to_snatch(self, si: SearchItem) -> None:
-        if not si.torrent_entry:  # pragma: no cover
+    def add_search_item_to_snatch(self, si: SearchItem) -> SkipReason | None:
+        """
+        Registers a matched `SearchItem` for snatching. In the scraper flow, returns `SkipReason.DUPE_OF_ANOTHER_REC`
+        instead when another rec already claimed the same torrent. Ad-hoc searches are never batched, so they skip the
+        dupe check.
+        """
+        if not (te := si.torrent_entry):  # pragma: no cover
             raise MissingTorrentEntryException("SearchItem missing torrent entry")
         if si.is_manual:
             self._manual_search_item_to_snatch = si
-        else:
-            self._search_items_to_snatch.append(si)
-            self._tids_to_snatch.add(si.torrent_entry.torrent_id)
+            return None
+        if te.torrent_id in self._tids_to_snatch:
+            return SkipReason.DUPE_OF_ANOTHER_REC
+        self._tids_to_snatch.add(te.torrent_id)
+        self._search_items_to_snatch.append(si)
+        return None
 
     def record_matched_result_row(self) -> None:
         """
@@ -202,8 +246,14 @@ class SearchState:
         applied here — the per-torrent `max_size_gb` cap was already applied during matching, and the cumulative
         ratio-based cap only governs automatic snatching, not the user's explicit retroactive selection.
         """
-        for si in self._search_items_to_snatch:
-            self._record_matched_row(si=si)
+        # Written as one batch at the end of the run, rather than a DB session + commit per matched item.
+        rows = [
+            (si.search_id, self._matched_status_kwargs(si=si, te=te))
+            for si in self._search_items_to_snatch
+            if (te := si.torrent_entry) is not None
+        ]
+        if rows:
+            set_result_status_rows(status=Status.MATCHED, rows=rows)
 
     def _record_matched_row(self, si: SearchItem) -> None:
         """Writes the `MATCHED` status row for a single matched `SearchItem`."""
@@ -211,19 +261,20 @@ class SearchState:
         if te is None:
             return
         set_result_status(
-            search_id=si.search_id,
-            status=Status.MATCHED,
-            status_model_kwargs={
-                "tid": te.torrent_id,
-                "red_permalink": te.get_permalink_url(),
-                "matched_mbid": si.get_matched_mbid(),
-                "size_gb": te.get_size(unit="GB"),
-                "media": te.media,
-                "format": te.format,
-                "encoding": te.encoding,
-            },
+            search_id=si.search_id, status=Status.MATCHED, status_model_kwargs=self._matched_status_kwargs(si=si, te=te)
         )
 
+    def _matched_status_kwargs(self, si: SearchItem, te: TorrentEntry) -> dict[str, Any]:
+        """The `Matched` status-row kwargs for a matched `SearchItem` and its torrent."""
+        return {
+            **self._matched_release_fields(si=si, te=te),
+            "tid": te.torrent_id,
+            "size_gb": si.size_gb,
+            "media": te.media,
+            "format": te.format,
+            "encoding": te.encoding,
+        }
+
     def get_search_items_to_snatch(self, manual_run: bool = False) -> list[SearchItem]:
         """
         Called by the ReleaseSearcher, returns the list of SearchItems which should be snatched following the full searching and filtering of recs.
@@ -240,39 +291,51 @@ class SearchState:
             return [self._manual_search_item_to_snatch]
         elif manual_run:
             return []
+        # Read each item's size once, for both the sort and the cumulative-size check.
         search_elems_by_size = sorted(
-            self._search_items_to_snatch,
-            key=lambda si: si.torrent_entry.get_size(unit="MB"),  # type: ignore [union-attr]
-            reverse=True,  # type: ignore
+            ((si.size_gb, si) for si in self._search_items_to_snatch), key=itemgetter(0), reverse=True
         )
         will_snatch: list[SearchItem] = []
+        skipped: list[SearchItem] = []
         cumulative_dl_size_gb = 0.0
-        for si in search_elems_by_size:
-            valid_te_size = self._te_size_acceptable(cumulative_dl_size_gb=cumulative_dl_size_gb, si=si)
-            if valid_te_size >= 0:  # pragma: no cover
+        for te_size_gb, si in search_elems_by_size:
+            valid_te_size = self._te_size_acceptable(
+                cumulative_dl_size_gb=cumulative_dl_size_gb, si=si, te_size_gb=te_size_gb
+            )
+            if valid_te_size >= 0:
                 cumulative_dl_size_gb += valid_te_size
                 will_snatch.append(si)
+            else:
+                skipped.append(si)
+        # Record every ratio-limited skip in one DB round trip rather than one per item.
+        if skipped:
+            self._add_skipped_snatch_rows(sis=skipped, reason=SkipReason.MIN_RATIO_LIMIT)
         return will_snatch
 
-    def _te_size_acceptable(self, cumulative_dl_size_gb: float, si: SearchItem) -> float:
+    def _te_size_acceptable(self, cumulative_dl_size_gb: float, si: SearchItem, te_size_gb: float) -> float:
         """
-        Returns `si.torrent_entry` size in GB when the provided `te` size will not cause `cumulative_dl_size_gb` to
-        exceed `self._max_download_allowed_gb`. Otherwise, returns a negative number.
+        Returns `te_size_gb` (the size in GB of `si`'s matched torrent) when adding it will not cause
+        `cumulative_dl_size_gb` to exceed `self._max_download_allowed_gb`. Otherwise, logs the skip and returns a
+        negative number (the caller records the skip).
         """
         if not (te := si.torrent_entry):  # pragma: no cover
             raise MissingTorrentEntryException("Missing torrent_entry")
-        te_size_gb = te.get_size("GB")
         if cumulative_dl_size_gb + te_size_gb <= self._max_download_allowed_gb:
             return te_size_gb
-        _LOGGER.info(f"Skip snatch {te.get_permalink_url}: would drop ratio below min_allowed_ratio.")
-        self._add_skipped_snatch_row(si=si, reason=SkipReason.MIN_RATIO_LIMIT)
+        _LOGGER.info("Skip snatch %s: would drop ratio below min_allowed_ratio.", te.get_permalink_url())
         return -1.0
 
-    def _add_skipped_snatch_row(self, si: SearchItem, reason: SkipReason) -> None:  # pragma: no cover
-        _LOGGER.debug(
-            f"Refreshing result record for search state artist='{si.artist_name}' entity_name='{si.initial_info.get_human_readable_entity_str()}' ..."
+    def _add_skipped_snatch_rows(self, sis: list[SearchItem], reason: SkipReason) -> None:
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            for si in sis:
+                _LOGGER.debug(
+                    "Refreshing result record for search state artist='%s' entity_name='%s' ...",
+                    si.artist_name,
+                    si.entity_name,
+                )
+        set_result_statuses(
+            search_ids=[si.search_id for si in sis], status=Status.SKIPPED, status_model_kwargs={"skip_reason": reason}
         )
-        set_result_status(search_id=si.search_id, status=Status.SKIPPED, status_model_kwargs={"skip_reason": reason})
 
     def _add_failed_snatch_row(self, si: SearchItem, exc_name: str) -> None:  # pragma: no cover
         snatch_failure_reason = FailReason.OTHER
@@ -282,12 +345,16 @@ class SearchState:
             search_id=si.search_id,
             status=Status.FAILED,
             status_model_kwargs={
-                "red_permalink": si.torrent_entry.get_permalink_url() if si.torrent_entry else None,
-                "matched_mbid": si.get_matched_mbid(),
+                **self._matched_release_fields(si=si, te=si.torrent_entry),
                 "fail_reason": snatch_failure_reason,
             },
         )
 
+    @staticmethod
+    def _matched_release_fields(si: SearchItem, te: TorrentEntry | None) -> dict[str, Any]:
+        """The RED-match fields shared by the `MATCHED` and `FAILED` result rows, built in one place."""
+        return {"red_permalink": te.get_permalink_url() if te else None, "matched_mbid": si.get_matched_mbid()}
+
     def _add_grabbed_row(self, si: SearchItem, snatch_path: str, snatched_with_fl: bool) -> None:  # pragma: no cover
         if not (te := si.torrent_entry):  # pragma: no cover
             raise MissingTorrentEntryException("Missing expected torrent_entry field.")
@@ -308,20 +375,26 @@ class SearchState:
         `cd_only_extras` are intentionally ignored, preserving the semantics of the previous browse-query filtering).
         """
         above_max_size_found = False
-        for pref in self._red_format_preferences:
-            for release_entry in release_entries:
-                for torrent_entry in release_entry.get_torrent_entries():
-                    if not self._torrent_matches_format(torrent_entry=torrent_entry, pref=pref):
-                        continue
-                    if torrent_entry.get_size(unit="GB") <= self._max_size_gb:
-                        return TorrentMatch(torrent_entry=torrent_entry, above_max_size_found=False)
-                    above_max_size_found = True
+        max_size_gb = self._max_size_gb
+        format_pref_ranks = self._format_pref_ranks
+        best_te: TorrentEntry | None = None
+        best_rank = len(format_pref_ranks)
+        for torrent_entry in chain.from_iterable(
+            release_entry.get_torrent_entries() for release_entry in release_entries
+        ):
+            te_format = torrent_entry.red_format
+            if te_format is None:
+                continue
+            rank = format_pref_ranks.get(te_format.match_key, best_rank)
+            # Only a strictly better-ranked torrent can replace the current best; earlier (better-seeded) ones win ties.
+            if rank >= best_rank:
+                continue
+            if torrent_entry.size_gb > max_size_gb:
+                above_max_size_found = True
+                continue
+            best_te, best_rank = torrent_entry, rank
+            if rank == 0:
+                break
+        if best_te is not None:
+            return TorrentMatch(torrent_entry=best_te, above_max_size_found=False)
         return TorrentMatch(torrent_entry=None, above_max_size_found=above_max_size_found)
-
-    @staticmethod
-    def _torrent_matches_format(torrent_entry: TorrentEntry, pref: FormatPreference) -> bool:
-        """Whether a torrent's format/encoding/media matches a format preference (ignoring `cd_only_extras`)."""
-        te_format = torrent_entry.red_format
-        return te_format is not None and (
-            te_format.format == pref.format and te_format.encoding == pref.encoding and te_format.media == pref.media
-        )
@@ -1,4 +1,5 @@
 import logging
+import time
 from collections.abc import Callable
 from datetime import datetime, timedelta
 from typing import Any
@@ -34,21 +35,24 @@ class RunCache:
 
     def __init__(self, app_settings: AppSettings, cache_type: str):
         self._expiration_datetime = _tomorrow_midnight_datetime()
+        self._expiration_epoch = int(self._expiration_datetime.timestamp())
         self._cache_type = cache_type
         self._enabled = app_settings.is_cache_enabled(cache_type=self._cache_type)
-        LOGGER.debug(f"RunCache of type {self._cache_type} instantiated and enabled set to: {self._enabled}")
+        LOGGER.debug("RunCache of type %s instantiated and enabled set to: %s", self._cache_type, self._enabled)
         self._cache_dir_path = app_settings.get_cache_directory_path(cache_type=self._cache_type)
-        LOGGER.debug(f"RunCache of type {self._cache_type} directory path: {self._cache_dir_path}")
+        LOGGER.debug("RunCache of type %s directory path: %s", self._cache_type, self._cache_dir_path)
         if self._enabled:
-            LOGGER.debug(f"Enabling diskcache for {self._cache_type} ...")
+            LOGGER.debug("Enabling diskcache for %s ...", self._cache_type)
             self._cache = Cache(self._cache_dir_path)
-            LOGGER.debug(f"diskcache instantiated for {self._cache_type} ...")
+            LOGGER.debug("diskcache instantiated for %s ...", self._cache_type)
             self._cache.stats(enable=True, reset=True)
             # TODO: make sure that this doesn't need to be called in each load call or more frequently than on construction
             num_expired = self._cache.expire()
-            LOGGER.debug(f"{num_expired} expired entries detected in {self._cache_type} cache.")
+            LOGGER.debug("%s expired entries detected in %s cache.", num_expired, self._cache_type)
             LOGGER.info(
-                f"Any newly added {self._cache_type} cache entries will expire on {self._expiration_datetime.strftime('%Y_%m_%d %H:%M:%S')}"
+                "Any newly added %s cache entries will expire on %s",
+                self._cache_type,
+                self._expiration_datetime.strftime("%Y_%m_%d %H:%M:%S"),
             )
         self._default_disabled_exception_msg = f"{self._cache_type} cache is not enabled. To enable it, set {self._cache_type}_cache_enabled to true in config.yaml."
 
@@ -63,7 +67,7 @@ class RunCache:
         if self._enabled:
             self._cache.close()
             return
-        LOGGER.warning(f"close() call on disabled {self._cache_type} cache has no effect.")
+        LOGGER.warning("close() call on disabled %s cache has no effect.", self._cache_type)
 
     def load_data_if_valid(self, cache_key: Any, data_validator_fn: Callable) -> Any:
         if not self._enabled:
@@ -73,18 +77,22 @@ class RunCache:
             return None
         try:
             if not data_validator_fn(cached_data):
-                LOGGER.warning(f"Cached {self._cache_type} data is not valid.")
+                LOGGER.warning("Cached %s data is not valid.", self._cache_type)
                 return None
         except Exception:
             LOGGER.error(
-                f"Encountered uncaught error during validation of {self._cache_type} data under cache key '{cache_key}'."
+                "Encountered uncaught error during validation of %s data under cache key '%s'.",
+                self._cache_type,
+                cache_key,
             )
-            del self._cache[cache_key]
+            self._cache.delete(cache_key, retry=True)
             return None
         return cached_data
 
     def _seconds_to_expiry(self) -> int:
-        return (self._expiration_datetime - datetime.now()).seconds
+        # Note: the expiry may be more than a day out (see `_tomorrow_midnight_datetime`), so this is computed from the
+        # epoch seconds rather than `timedelta.seconds`, which drops whole days.
+        return max(0, self._expiration_epoch - int(time.time()))
 
     def write_data(self, cache_key: Any, data: Any) -> bool:
         if not self._enabled:
@@ -1,17 +1,19 @@
 import logging
 import re
-from random import randint
+import sys
+from random import uniform
 from time import sleep
-from typing import Any
+from typing import Any, NamedTuple
 
-from bs4 import BeautifulSoup
-from rebrowser_playwright.sync_api import BrowserType, Error, Page, Playwright, sync_playwright
+from bs4 import BeautifulSoup, SoupStrainer
+from rebrowser_playwright.sync_api import BrowserType, Error, Page, Playwright, Route, sync_playwright
 
 from plastered.config.app_settings import AppSettings
 from plastered.models import EntityType, LFMRec, RecContext
 from plastered.run_cache.run_cache import RunCache
 from plastered.utils.constants import (
     ALBUM_REC_CONTEXT_BS4_CSS_SELECTOR,
+    ALBUM_REC_ITEM_BS4_CLASS,
     ALBUM_REC_LIST_ELEMENT_BS4_CSS_SELECTOR,
     ALBUM_REC_LIST_ELEMENT_CSS_SELECTOR,
     ALBUM_RECS_BASE_URL,
@@ -21,10 +23,13 @@ from plastered.utils.constants import (
     LOGIN_URL,
     LOGIN_USERNAME_FORM_LOCATOR,
     LOGOUT_URL,
+    PAGE_LOAD_JITTER_SEC_MAX,
+    PAGE_LOAD_JITTER_SEC_MIN,
     PW_USER_AGENT,
     RENDER_WAIT_SEC_MAX,
     RENDER_WAIT_SEC_MIN,
     TRACK_REC_CONTEXT_CSS_SELECTOR,
+    TRACK_REC_ITEM_BS4_CLASS,
     TRACK_REC_LIST_ELEMENT_BS4_CSS_SELECTOR,
     TRACK_REC_LIST_ELEMENT_CSS_SELECTOR,
     TRACK_RECS_BASE_URL,
@@ -36,6 +41,48 @@ _LOGGER = logging.getLogger(__name__)
 
 _ARTIST_ALBUM_REGEX_PATTERN = re.compile(r"^\/music\/([^\/]+)\/(.+)$")
 _ARTIST_TRACK_REGEX_PATTERN = re.compile(r"^\/music\/([^\/]+)\/_\/(.+)$")
+_LOGOUT_BUTTON_NAME_PATTERN = re.compile("logout", re.IGNORECASE)
+# Only the rec list items (and their descendants) are needed from a recs page, so the parser is restricted to building
+# those subtrees rather than the whole page (nav, scripts, footer, etc.).
+_ALBUM_RECS_STRAINER = SoupStrainer("li", class_=ALBUM_REC_ITEM_BS4_CLASS)
+_TRACK_RECS_STRAINER = SoupStrainer("li", class_=TRACK_REC_ITEM_BS4_CLASS)
+# Resource types the scraper never reads, so requests for them are aborted rather than downloaded. Stylesheets are still
+# let through since the login / logout flows rely on Playwright's visibility checks.
+_BLOCKED_RESOURCE_TYPES: frozenset[str] = frozenset({"image", "font", "media"})
+# Trailing text of a rec's context element when the rec'd artist is already in the user's library.
+_IN_LIBRARY_CONTEXT_SUFFIX = "in your library"
+
+
+class _RecsPageConfig(NamedTuple):
+    """Everything that differs between scraping the album and the track recs pages."""
+
+    base_url: str
+    # Rendered-page selector to wait on before reading the page source.
+    wait_css_selector: str
+    recs_strainer: SoupStrainer
+    rec_link_selector: str
+    rec_context_selector: str
+    rec_href_pattern: re.Pattern[str]
+
+
+_RECS_PAGE_CONFIGS: dict[EntityType, _RecsPageConfig] = {
+    EntityType.ALBUM: _RecsPageConfig(
+        base_url=ALBUM_RECS_BASE_URL,
+        wait_css_selector=ALBUM_REC_LIST_ELEMENT_CSS_SELECTOR,
+        recs_strainer=_ALBUM_RECS_STRAINER,
+        rec_link_selector=ALBUM_REC_LIST_ELEMENT_BS4_CSS_SELECTOR,
+        rec_context_selector=ALBUM_REC_CONTEXT_BS4_CSS_SELECTOR,
+        rec_href_pattern=_ARTIST_ALBUM_REGEX_PATTERN,
+    ),
+    EntityType.TRACK: _RecsPageConfig(
+        base_url=TRACK_RECS_BASE_URL,
+        wait_css_selector=TRACK_REC_LIST_ELEMENT_CSS_SELECTOR,
+        recs_strainer=_TRACK_RECS_STRAINER,
+        rec_link_selector=TRACK_REC_LIST_ELEMENT_BS4_CSS_SELECTOR,
+        rec_context_selector=TRACK_REC_CONTEXT_CSS_SELECTOR,
+        rec_href_pattern=_ARTIST_TRACK_REGEX_PATTERN,
+    ),
+}
 
 # Last.fm can trigger a client-side navigation between the rec list appearing and the page-source read, which makes
 # `page.content()` raise "Unable to retrieve content because the page is navigating and changing the content". We wait
@@ -47,12 +94,20 @@ _CONTENT_READ_MAX_ATTEMPTS = 3
 _PAGE_SETTLE_TIMEOUT_MS = 5000
 
 
-def _sleep_random() -> None:
+def _block_unneeded_resources(route: Route) -> None:
+    """Page route handler which aborts requests for resource types the scraper never reads."""
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        route.abort()
+    else:
+        route.continue_()
+
+
+def _sleep_random(min_seconds: float = RENDER_WAIT_SEC_MIN, max_seconds: float = RENDER_WAIT_SEC_MAX) -> None:
     """
     Very dumb utility function to sleep a bounded random number of seconds between playwright client interactions with the LFM site to reduce predictability.
     """
-    sleep_seconds = randint(RENDER_WAIT_SEC_MIN, RENDER_WAIT_SEC_MAX)  # nosec B311
-    _LOGGER.debug(f"Sleeping for {sleep_seconds} before continuing ...")
+    sleep_seconds = uniform(min_seconds, max_seconds)  # nosec B311
+    _LOGGER.debug("Sleeping for %.2fs before continuing ...", sleep_seconds)
     sleep(sleep_seconds)
 
 
@@ -61,7 +116,7 @@ def cached_lfm_recs_validator(cached_data: Any) -> bool:
     """
     Passed to the RunCache.load_from_cache_if_valid method when attempting loads of cached LFM recs.
     """
-    return isinstance(cached_data, list) and all([isinstance(elem, LFMRec) for elem in cached_data])
+    return isinstance(cached_data, list) and all(isinstance(elem, LFMRec) for elem in cached_data)
 
 
 class LFMRecsScraper:
@@ -88,7 +143,7 @@ class LFMRecsScraper:
             self._loaded_from_run_cache[rec_type] = self._run_cache.load_data_if_valid(
                 cache_key=rec_type.value, data_validator_fn=cached_lfm_recs_validator
             )
-        if all([cached_recs is not None for _, cached_recs in self._loaded_from_run_cache.items()]):
+        if all(cached_recs is not None for cached_recs in self._loaded_from_run_cache.values()):
             _LOGGER.info("Scraper cache enabled and cache hit successful for all enabled rec types.")
             _LOGGER.info("Skipping scraper browser initialization.")
             return self
@@ -103,6 +158,7 @@ class LFMRecsScraper:
                 msg = "Unable to open a new page in playwright browser. Exiting."
                 _LOGGER.error(msg)
                 raise ScraperException(msg)
+            self._page.route("**/*", _block_unneeded_resources)
             _LOGGER.info("Attempting Last.fm user login ...")
             self._user_login()
         return self
@@ -136,27 +192,27 @@ class LFMRecsScraper:
         _LOGGER.debug("Calling sleep_random ...")
         _sleep_random()
         self._is_logged_in = True
-        _LOGGER.debug(f"Current driver page URL: {self._page.url}")
+        _LOGGER.debug("Current driver page URL: %s", self._page.url)
 
     def _user_logout(self) -> None:
         if not self._page:  # pragma: no cover
             raise ScraperException("Page is not initialized")
         _LOGGER.debug("Logging out from last.fm account ...")
         self._page.goto(LOGOUT_URL, wait_until="domcontentloaded")
-        self._page.get_by_role("button", name=re.compile("logout", re.IGNORECASE)).locator("visible=true").first.click()
+        self._page.get_by_role("button", name=_LOGOUT_BUTTON_NAME_PATTERN).locator("visible=true").first.click()
         self._is_logged_in = False
 
     def _navigate_to_page_and_get_page_source(self, url: str, rec_type: EntityType) -> str:
         if not self._page:  # pragma: no cover
             raise ScraperException("Page is not initialized")
-        _LOGGER.info(f"Rendering {url} page source ...")
+        _LOGGER.info("Rendering %s page source ...", url)
         self._page.goto(url, wait_until="domcontentloaded")
-        wait_css_selector = (
-            ALBUM_REC_LIST_ELEMENT_CSS_SELECTOR if rec_type == EntityType.ALBUM else TRACK_REC_LIST_ELEMENT_CSS_SELECTOR
-        )
-        recs_page_locator = self._page.locator(wait_css_selector)  # pylint: disable=unused-variable
-        recs_page_locator.first.wait_for()
-        _sleep_random()
+        # The rec list is server-rendered, so once the DOM has loaded every rec item is in it; waiting on the first item
+        # then confirms a rec list actually rendered (e.g. rather than a login wall) before the page source is read.
+        self._page.locator(_RECS_PAGE_CONFIGS[rec_type].wait_css_selector).first.wait_for()
+        # Short randomized pause between recs page loads so back-to-back requests under the user's session stay
+        # unpredictable; the longer login-flow wait isn't needed for that.
+        _sleep_random(min_seconds=PAGE_LOAD_JITTER_SEC_MIN, max_seconds=PAGE_LOAD_JITTER_SEC_MAX)
         return self._read_page_content(page=self._page)
 
     @staticmethod
@@ -177,8 +233,8 @@ class LFMRecsScraper:
                 if _PAGE_NAVIGATING_ERR_FRAGMENT not in str(err) or is_last_attempt:
                     raise
                 _LOGGER.warning(
-                    f"Page navigating while reading content (attempt {attempt + 1}); "
-                    "waiting for network idle and retrying ..."
+                    "Page navigating while reading content (attempt %d); waiting for network idle and retrying ...",
+                    attempt + 1,
                 )
                 try:
                     page.wait_for_load_state("networkidle", timeout=_PAGE_SETTLE_TIMEOUT_MS)
@@ -189,31 +245,34 @@ class LFMRecsScraper:
         raise ScraperException("Exhausted page-content read attempts")  # pragma: no cover
 
     def _extract_recs_from_page_source(self, page_source: str, rec_type: EntityType) -> list[LFMRec]:
-        soup = BeautifulSoup(page_source, "html.parser")
-        if rec_type == EntityType.ALBUM:
-            rec_class_name = ALBUM_REC_LIST_ELEMENT_BS4_CSS_SELECTOR
-            entity_rec_context_class_name = ALBUM_REC_CONTEXT_BS4_CSS_SELECTOR
-            recommendation_regex_pattern = _ARTIST_ALBUM_REGEX_PATTERN
-        else:
-            rec_class_name = TRACK_REC_LIST_ELEMENT_BS4_CSS_SELECTOR
-            entity_rec_context_class_name = TRACK_REC_CONTEXT_CSS_SELECTOR
-            recommendation_regex_pattern = _ARTIST_TRACK_REGEX_PATTERN
-
-        rec_hrefs = [li.get("href") for li in soup.select(rec_class_name)]
-        entity_rec_contexts = [elem.text.strip() for elem in soup.select(entity_rec_context_class_name)]
+        page_config = _RECS_PAGE_CONFIGS[rec_type]
+        rec_link_selector = page_config.rec_link_selector
+        rec_context_selector = page_config.rec_context_selector
+        rec_href_pattern = page_config.rec_href_pattern
+        soup = BeautifulSoup(page_source, "html.parser", parse_only=page_config.recs_strainer)
+
         page_recs: list[LFMRec] = []
-        for i, href_value in enumerate(rec_hrefs):
-            regex_match = re.match(recommendation_regex_pattern, href_value)  # type: ignore
-            if not regex_match:  # pragma: no cover
+        # The strainer leaves exactly the rec list items as the soup's top-level tags. Reading each rec's link and
+        # context from within its own item pairs them structurally (no index-aligned lists), in one pass over the items.
+        for rec_item in soup.find_all(recursive=False):
+            rec_link = rec_item.select_one(rec_link_selector)
+            href_value = rec_link.get("href") if rec_link is not None else None
+            if not isinstance(href_value, str) or not (regex_match := rec_href_pattern.match(href_value)):
                 continue
             artist, entity = regex_match.groups()
+            # Recs frequently share an artist. Interning makes those recs share one string object, which pickle then
+            # writes to the run cache once and memo-references thereafter.
+            artist = sys.intern(artist)
+            # Only the context text's tail matters, so it is right-stripped only.
+            rec_context_elem = rec_item.select_one(rec_context_selector)
             entity_rec_context = (
                 RecContext.IN_LIBRARY
-                if entity_rec_contexts[i].endswith("in your library")
+                if rec_context_elem is not None
+                and rec_context_elem.get_text().rstrip().endswith(_IN_LIBRARY_CONTEXT_SUFFIX)
                 else RecContext.SIMILAR_ARTIST
             )
-            _LOGGER.debug(f"artist: {artist}")
-            _LOGGER.debug(f"{rec_type.value}: {entity}")
+            _LOGGER.debug("artist: %s", artist)
+            _LOGGER.debug("%s: %s", rec_type.value, entity)
             page_recs.append(
                 LFMRec(
                     lfm_artist_str=artist,
@@ -227,9 +286,9 @@ class LFMRecsScraper:
     def _scrape_recs_list(self, rec_type: EntityType) -> list[LFMRec]:
         if cached_list := self._loaded_from_run_cache.get(rec_type):
             return cached_list
-        _LOGGER.info(f"Scraping '{rec_type.value}' recommendations from LFM ...")
+        _LOGGER.info("Scraping '%s' recommendations from LFM ...", rec_type.value)
         recs: list[LFMRec] = []
-        recs_base_url = ALBUM_RECS_BASE_URL if rec_type == EntityType.ALBUM else TRACK_RECS_BASE_URL
+        recs_base_url = _RECS_PAGE_CONFIGS[rec_type].base_url
         for page_number in range(1, self._max_rec_pages_to_scrape + 1):
             recs_page_url = f"{recs_base_url}?page={page_number}"
             recs_page_source = self._navigate_to_page_and_get_page_source(url=recs_page_url, rec_type=rec_type)
@@ -237,7 +296,7 @@ class LFMRecsScraper:
         if self._run_cache.enabled:
             _LOGGER.debug("Attempting cache write for scraper ...")
             cache_write_success = self._run_cache.write_data(cache_key=rec_type.value, data=recs)
-            _LOGGER.debug(f"Scraper cache write: {cache_write_success}")
+            _LOGGER.debug("Scraper cache write: %s", cache_write_success)
         return recs
 
     def scrape_recs(self) -> dict[EntityType, list[LFMRec]]:
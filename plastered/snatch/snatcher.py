@@ -32,7 +32,7 @@ class Snatcher:
             _LOGGER.warning("Not configured to snatch. Please update your config to enable.")
             return
         if search_items_to_snatch := self.search_state.get_search_items_to_snatch(manual_run=manual_run):
-            _LOGGER.debug(f"Beginning to snatch matched torrents to download directory '{self.snatch_directory}' ...")
+            _LOGGER.debug("Beginning to snatch matched torrents to download directory '%s' ...", self.snatch_directory)
             for si_to_snatch in search_items_to_snatch:
                 self._snatch_match(si_to_snatch=si_to_snatch)
         else:  # pragma: no cover
@@ -47,7 +47,7 @@ class Snatcher:
         permalink = te_to_snatch.get_permalink_url()
         out_filepath = Path(os.path.join(self.snatch_directory, f"{tid}.torrent"))
         exc_name: str | None = None
-        _LOGGER.debug(f"Snatching {permalink} and saving to {out_filepath} ...")
+        _LOGGER.debug("Snatching %s and saving to %s ...", permalink, out_filepath)
         try:
             binary_contents = self.red_snatch_client.snatch(tid=str(tid), can_use_token=te_to_snatch.can_use_token)
             out_filepath.write_bytes(binary_contents)
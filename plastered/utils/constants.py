@@ -12,6 +12,8 @@ CACHE_TYPE_SCRAPER: Final[str] = "scraper"
 
 RENDER_WAIT_SEC_MIN: Final[int] = 3
 RENDER_WAIT_SEC_MAX: Final[int] = 7
+PAGE_LOAD_JITTER_SEC_MIN: Final[float] = 1.0
+PAGE_LOAD_JITTER_SEC_MAX: Final[float] = 2.0
 
 PW_USER_AGENT: Final[str] = (
     "Mozilla/5.0 (Linux; Android 14; Pixel 7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.6099.28 Mobile Safari/537.36"
@@ -21,11 +23,13 @@ ALBUM_RECS_BASE_URL: Final[str] = "https://www.last.fm/music/+recommended/albums
 ALBUM_REC_LIST_ELEMENT_CSS_SELECTOR: Final[str] = ".music-recommended-albums-item-name"
 ALBUM_REC_LIST_ELEMENT_BS4_CSS_SELECTOR: Final[str] = ".music-recommended-albums-item-name a.link-block-target"
 ALBUM_REC_CONTEXT_BS4_CSS_SELECTOR: Final[str] = "p.music-recommended-albums-album-context"
+ALBUM_REC_ITEM_BS4_CLASS: Final[str] = "music-recommended-albums-item-wrap"
 
 TRACK_RECS_BASE_URL: Final[str] = "https://www.last.fm/music/+recommended/tracks"
 TRACK_REC_LIST_ELEMENT_CSS_SELECTOR: Final[str] = ".recommended-tracks-item-name"
 TRACK_REC_LIST_ELEMENT_BS4_CSS_SELECTOR: Final[str] = ".recommended-tracks-item-name a.link-block-target"
 TRACK_REC_CONTEXT_CSS_SELECTOR: Final[str] = "p.recommended-tracks-item-aux-text.recommended-tracks-item-context"
+TRACK_REC_ITEM_BS4_CLASS: Final[str] = "recommended-tracks-item-wrap"
 
 LOGIN_URL: Final[str] = "https://www.last.fm/login"
 LOGIN_USERNAME_FORM_LOCATOR: Final[str] = "[name='username_or_email']"
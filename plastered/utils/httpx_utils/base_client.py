@@ -45,7 +45,7 @@ class HTTPXRetryTransport(httpx.BaseTransport):
             wait=wait_fixed(self._min_wait_seconds), stop=stop_after_attempt(self._max_retries), reraise=True
         ):
             with attempt:
-                LOGGER.debug(f"Handling request attempt number: {attempt.retry_state.attempt_number} ...")
+                LOGGER.debug("Handling request attempt number: %s ...", attempt.retry_state.attempt_number)
                 response = self._transport.handle_request(request)
         return response
 
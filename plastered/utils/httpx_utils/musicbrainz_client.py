@@ -33,7 +33,7 @@ class MusicBrainzAPIClient(ThrottledAPIBaseClient):
         Returns the JSON response payload on success.
         Throws an Exception after `self._max_api_call_retries` consecutive failures.
         """
-        _LOGGER.debug(f"Searching musicbrainz for release-mbid: '{mbid}' ...")
+        _LOGGER.debug("Searching musicbrainz for release-mbid: '%s' ...", mbid)
         # Enforce request throttling before building and submitting the request.
         self._throttle()
         inc_params = "inc=artist-credits+media+labels+release-groups"
@@ -57,7 +57,9 @@ class MusicBrainzAPIClient(ThrottledAPIBaseClient):
         if human_readable_artist_name:
             return search_query_prefix + f"artist:{quote(human_readable_artist_name)}"
         LOGGER.debug(
-            f"Cannot resolve origin release for track rec: '{human_readable_track_name}'. No available artist_mbid or human readable artist name provided."
+            "Cannot resolve origin release for track rec: '%s'. No available artist_mbid or human readable artist name "
+            "provided.",
+            human_readable_track_name,
         )
         return None
 
@@ -73,7 +75,7 @@ class MusicBrainzAPIClient(ThrottledAPIBaseClient):
         If the origin release name cannot be resolved, returns None since the release name is required for searching on RED.
         Otherwise returns a dict of the the form {"origin_release_mbid": str | None, "origin_release_name": str | None}
         """
-        LOGGER.debug(f"Attempting to resolve origin release for track rec: track: '{si.track_name}' ...")
+        LOGGER.debug("Attempting to resolve origin release for track rec: track: '%s' ...", si.track_name)
         track_name = si.track_name
         artist_name = si.artist_name
         search_query_str = self._get_track_search_query_str(
@@ -94,10 +96,10 @@ class MusicBrainzAPIClient(ThrottledAPIBaseClient):
         try:
             first_release_match_json = json_data["recordings"][0]["releases"][0]
         except (KeyError, IndexError):
-            LOGGER.debug(f"Unable to resolve an origin release for track: '{track_name}' by '{artist_name}'")
+            LOGGER.debug("Unable to resolve an origin release for track: '%s' by '%s'", track_name, artist_name)
             return None
         rel_mbid, rel_name = first_release_match_json.get("id"), first_release_match_json.get("title")
         if not rel_name:
-            LOGGER.debug(f"Unable to resolve origin release title for track: '{track_name}' by '{artist_name}'")
+            LOGGER.debug("Unable to resolve origin release title for track: '%s' by '%s'", track_name, artist_name)
             return None
         return {"origin_release_mbid": rel_mbid, "origin_release_name": rel_name}
@@ -54,7 +54,7 @@ class RedAPIClient(ThrottledAPIBaseClient):
         """
         if self._red_user_details is not None:  # pragma: no cover
             return self._red_user_details
-        _LOGGER.debug(f"Gathering RED api responses to init RedUserDetails for user ID: '{self._red_user_id}' ...")
+        _LOGGER.debug("Gathering RED api responses to init RedUserDetails for user ID: '%s' ...", self._red_user_id)
         snatch_cnt, seed_cnt = self._rud_helper(action="community_stats")
         snatched_torrents_list = self._rud_helper(action="user_torrents", type_="snatched", lim=snatch_cnt)
         seeding_torrents_list = self._rud_helper(action="user_torrents", type_="seeding", lim=seed_cnt)
@@ -1,3 +1,5 @@
+import importlib
+import sys
 from typing import Any
 from unittest.mock import MagicMock, patch
 
@@ -83,3 +85,15 @@ def test_run_lfm_scraper_marks_failed_on_error(valid_app_settings: AppSettings)
             snatch_enabled=False,
         )
     assert any(call.kwargs.get("status") == ScraperRunStatus.FAILED for call in mock_update_run.call_args_list)
+
+
+def test_common_actions_defers_scraper_import(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The scraper (bs4 + playwright) should only be imported once a scraper run actually starts."""
+    import plastered.actions
+
+    monkeypatch.delitem(sys.modules, "plastered.scraper.lfm_scraper", raising=False)
+    monkeypatch.delitem(sys.modules, "plastered.actions.common_actions")
+    # The re-import below rebinds the package attribute too; record it so it is restored alongside `sys.modules`.
+    monkeypatch.setattr(plastered.actions, "common_actions", plastered.actions.common_actions)
+    importlib.import_module("plastered.actions.common_actions")
+    assert "plastered.scraper.lfm_scraper" not in sys.modules
@@ -5,8 +5,14 @@ import pytest
 from sqlmodel import Field, Session, SQLModel, create_engine, select
 from sqlmodel.pool import StaticPool
 
-from plastered.db.db_models import FailReason, SearchRecord, SkipReason, Status
-from plastered.db.db_utils import add_record, get_result_by_id, set_result_status
+from plastered.db.db_models import Failed, FailReason, Grabbed, Matched, SearchRecord, Skipped, SkipReason, Status
+from plastered.db.db_utils import (
+    add_record,
+    get_result_by_id,
+    set_result_status,
+    set_result_status_rows,
+    set_result_statuses,
+)
 from plastered.utils.exceptions import MissingDatabaseRecordException
 
 
@@ -46,16 +52,25 @@ def test_add_record_no_session() -> None:
 
 
 @pytest.mark.parametrize(
-    "mock_status, mock_status_model_kwargs",
+    "mock_status, mock_status_model_kwargs, expected_model, expected_fk_field",
     [
-        (Status.FAILED, {"red_permalink": None, "matched_mbid": None, "fail_reason": FailReason.OTHER}),
-        (Status.GRABBED, {"fl_token_used": None, "snatch_path": None, "tid": None}),
-        (Status.SKIPPED, {"skip_reason": SkipReason.NO_SOURCE_RELEASE_FOUND}),
-        (Status.MATCHED, {"tid": 420, "red_permalink": "https://red/x", "size_gb": 1.0}),
+        (
+            Status.FAILED,
+            {"red_permalink": None, "matched_mbid": None, "fail_reason": FailReason.OTHER},
+            Failed,
+            "f_result_id",
+        ),
+        (Status.GRABBED, {"fl_token_used": None, "snatch_path": None, "tid": None}, Grabbed, "g_result_id"),
+        (Status.SKIPPED, {"skip_reason": SkipReason.NO_SOURCE_RELEASE_FOUND}, Skipped, "s_result_id"),
+        (Status.MATCHED, {"tid": 420, "red_permalink": "https://red/x", "size_gb": 1.0}, Matched, "m_result_id"),
     ],
 )
 def test_set_result_status(
-    mock_album_result: SearchRecord, mock_status: Status, mock_status_model_kwargs: dict[str, Any]
+    mock_album_result: SearchRecord,
+    mock_status: Status,
+    mock_status_model_kwargs: dict[str, Any],
+    expected_model: type[SQLModel],
+    expected_fk_field: str,
 ) -> None:
     fake_id = 69
     mock_sesh = MagicMock()
@@ -66,9 +81,44 @@ def test_set_result_status(
         _ = set_result_status(search_id=fake_id, status=mock_status, status_model_kwargs=mock_status_model_kwargs)
         mock_get_result_by_id.assert_called_once_with(search_id=fake_id, session=mock_sesh)
         assert len(mock_sesh.add.mock_calls) == 2
+        status_record = mock_sesh.add.mock_calls[1].args[0]
+        assert isinstance(status_record, expected_model)
+        assert getattr(status_record, expected_fk_field) == fake_id
         mock_sesh.commit.assert_called_once()
 
 
+def test_set_result_statuses_single_commit(mock_album_result: SearchRecord) -> None:
+    mock_sesh = MagicMock()
+    with (
+        patch.object(Session, "__enter__", return_value=mock_sesh),
+        patch("plastered.db.db_utils.get_result_by_id", return_value=mock_album_result) as mock_get_result_by_id,
+    ):
+        set_result_statuses(
+            search_ids=[1, 2, 3], status=Status.SKIPPED, status_model_kwargs={"skip_reason": SkipReason.MIN_RATIO_LIMIT}
+        )
+        assert mock_get_result_by_id.call_count == 3
+        assert len(mock_sesh.add.mock_calls) == 6
+        mock_sesh.commit.assert_called_once()
+
+
+def test_set_result_status_rows_per_row_kwargs(mock_album_result: SearchRecord) -> None:
+    mock_sesh = MagicMock()
+    with (
+        patch.object(Session, "__enter__", return_value=mock_sesh),
+        patch("plastered.db.db_utils.get_result_by_id", return_value=mock_album_result),
+    ):
+        set_result_status_rows(
+            status=Status.MATCHED,
+            rows=[
+                (1, {"tid": 10, "red_permalink": "https://red/10"}),
+                (2, {"tid": 20, "red_permalink": "https://red/20"}),
+            ],
+        )
+    status_records = [call.args[0] for call in mock_sesh.add.mock_calls[1::2]]
+    assert [(r.m_result_id, r.tid) for r in status_records] == [(1, 10), (2, 20)]
+    mock_sesh.commit.assert_called_once()
+
+
 def test_set_result_status_fails() -> None:
     with pytest.raises(MissingDatabaseRecordException):
         set_result_status(search_id=None, status=Status.FAILED, status_model_kwargs={})
@@ -21,6 +21,13 @@ def test_red_format_eq(other: Any, expected: bool) -> None:
     assert actual == expected, f"Expected {test_instance}.__eq__(other={other}) to be {expected}, but got {actual}"
 
 
+def test_red_format_match_key() -> None:
+    test_instance = RedFormat(format=FormatEnum.MP3, encoding=EncodingEnum.MP3_V0, media=MediaEnum.WEB)
+    assert test_instance.match_key == (FormatEnum.MP3, EncodingEnum.MP3_V0, MediaEnum.WEB)
+    test_instance.media = MediaEnum.CD
+    assert test_instance.match_key == (FormatEnum.MP3, EncodingEnum.MP3_V0, MediaEnum.CD)
+
+
 @pytest.mark.parametrize(
     "release_type_str, expected",
     [
@@ -235,6 +242,28 @@ def test_torrent_entry_get_size(
         assert actual == expected, f"Expected get_size(unit='{unit}') to return {expected}, but got {actual}"
 
 
+def test_torrent_entry_size_gb() -> None:
+    kwargs: dict[str, Any] = dict(
+        torrent_id=69420,
+        media="WEB",
+        format="FLAC",
+        encoding="Lossless",
+        size=3e9,
+        scene=False,
+        trumpable=False,
+        has_snatched=False,
+        has_log=False,
+        log_score=0,
+        has_cue=False,
+        can_use_token=False,
+    )
+    test_instance = TorrentEntry(**kwargs)
+    assert test_instance.size_gb == 3.0
+    assert test_instance.size_gb == test_instance.get_size(unit="GB")
+    test_instance.size = 6e9
+    assert test_instance.size_gb == 6.0
+
+
 def test_torrent_entry_get_red_format() -> None:
     test_instance = TorrentEntry(
         torrent_id=69420,
@@ -337,50 +366,16 @@ def test_red_user_details_snatched_torrents_dict(
 
 
 @pytest.mark.parametrize(
-    "mock_snatched_torrents_dict, mock_artist, mock_release, expected",
-    [
-        (dict(), "Fake Artist", "Their Release", False),
-        ({("some artist", "a release"): None}, "other artist", "different release", False),
-        ({("same artist", "a release"): None}, "same artist", "different release", False),
-        ({("other artist", "first release"): None}, "other artist", "second release", False),
-        ({("some artist", "a release"): None}, "some artist", "a release", True),
-        ({("some artist", "a release"): None}, "Some Artist", "A Release", True),
-        (
-            {("some artist", "a release"): None, ("another artist", "their release"): None},
-            "other artist",
-            "a release",
-            False,
-        ),
-        (
-            {("some artist", "a release"): None, ("another artist", "their release"): None},
-            "some artist",
-            "their release",
-            False,
-        ),
-        (
-            {("some artist", "a release"): None, ("another artist", "their release"): None},
-            "some artist",
-            "a release",
-            True,
-        ),
-        (
-            {("some artist", "a release"): None, ("another artist", "their release"): None},
-            "Some Artist",
-            "A Release",
-            True,
-        ),
-    ],
+    "mock_snatched_torrents_dict",
+    [dict(), {("some artist", "a release"): None, ("another artist", "their release"): None}],
 )
-def test_red_user_details_has_snatched_release(
-    mock_red_user_details_fn_scoped: RedUserDetails,
-    mock_snatched_torrents_dict: dict[str, Any],
-    mock_artist: str,
-    mock_release: str,
-    expected: bool,
+def test_red_user_details_snatched_release_pairs(
+    mock_red_user_details_fn_scoped: RedUserDetails, mock_snatched_torrents_dict: dict[str, Any]
 ) -> None:
     mock_red_user_details_fn_scoped._snatched_torrents_dict = mock_snatched_torrents_dict
-    actual = mock_red_user_details_fn_scoped.has_snatched_release(artist=mock_artist, release=mock_release)
-    assert actual == expected
+    actual = mock_red_user_details_fn_scoped.snatched_release_pairs()
+    assert isinstance(actual, frozenset)
+    assert actual == frozenset(mock_snatched_torrents_dict.keys())
 
 
 @pytest.mark.parametrize(
@@ -394,19 +389,9 @@ def test_red_user_details_snatched_tids(
 ) -> None:
     mock_red_user_details_fn_scoped.snatched_torrents_list = mock_snatched_torrents_list
     actual = mock_red_user_details_fn_scoped._snatched_tids
+    assert isinstance(actual, frozenset)
     assert actual == expected
-
-
-@pytest.mark.parametrize(
-    "mock_snatched_tids, tid, expected",
-    [({}, 69, False), ({69}, 69, True), ({100, 69}, 69, True), ({100, 200, 300}, 5, False)],
-)
-def test_red_user_details_has_snatched_tid(
-    mock_red_user_details_fn_scoped: RedUserDetails, mock_snatched_tids: set[int], tid: int, expected: bool
-) -> None:
-    mock_red_user_details_fn_scoped._snatched_tids = mock_snatched_tids
-    actual = mock_red_user_details_fn_scoped.has_snatched_tid(tid)
-    assert actual == expected
+    assert mock_red_user_details_fn_scoped.snatched_tids() is actual
 
 
 @pytest.mark.parametrize("mock_available_fl_tokens, expected", [(-1, False), (0, False), (1, True), (69, True)])
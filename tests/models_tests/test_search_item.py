@@ -1,5 +1,13 @@
+from unittest.mock import patch
+
+import pytest
+
 from plastered.models.adhoc_search_models import AdhocSearch
+from plastered.models.lfm_models import LFMRec
+from plastered.models.red_models import TorrentEntry, TorrentMatch
 from plastered.models.search_item import SearchItem
+from plastered.models.types import EntityType, RecContext
+from plastered.utils.exceptions import LFMRecException, MissingTorrentEntryException
 
 
 def test_get_matched_mbid_adhoc_prefers_supplied_mbid() -> None:
@@ -15,3 +23,76 @@ def test_get_matched_mbid_adhoc_without_mbid_or_resolved_info() -> None:
 def test_adhoc_search_kwargs_seeded_from_user_fields() -> None:
     si = SearchItem(initial_info=AdhocSearch(artist="Some Artist", release="Some Album", release_year=1996))
     assert si.get_search_kwargs().get("year") == 1996
+
+
+def _make_te(size_bytes: float) -> TorrentEntry:
+    return TorrentEntry(
+        torrent_id=1,
+        media="WEB",
+        format="FLAC",
+        encoding="Lossless",
+        size=size_bytes,
+        scene=False,
+        trumpable=False,
+        has_snatched=False,
+        has_log=False,
+        log_score=0,
+        has_cue=False,
+        can_use_token=False,
+    )
+
+
+def test_size_gb_follows_torrent_match() -> None:
+    si = SearchItem(initial_info=AdhocSearch(artist="Some Artist", release="Some Album"))
+    si.set_torrent_match_fields(torrent_match=TorrentMatch(torrent_entry=_make_te(2e9), above_max_size_found=False))
+    assert si.size_gb == 2.0
+    si.torrent_entry = _make_te(size_bytes=5e9)
+    assert si.size_gb == 5.0
+
+
+def test_size_gb_missing_torrent_entry() -> None:
+    si = SearchItem(initial_info=AdhocSearch(artist="Some Artist", release="Some Album"))
+    with pytest.raises(MissingTorrentEntryException):
+        si.size_gb
+
+
+def test_human_readable_names_resolved_once_at_construction() -> None:
+    with (
+        patch.object(LFMRec, "get_human_readable_artist_str", return_value="Some Artist") as mock_artist_fn,
+        patch.object(LFMRec, "get_human_readable_entity_str", return_value="Some Album") as mock_entity_fn,
+    ):
+        si = SearchItem(initial_info=LFMRec("Some+Artist", "Some+Album", EntityType.ALBUM, RecContext.SIMILAR_ARTIST))
+        for _ in range(3):
+            assert si.artist_name == "Some Artist"
+            assert si.entity_name == "Some Album"
+        mock_artist_fn.assert_called_once()
+        mock_entity_fn.assert_called_once()
+
+
+def test_track_name_reuses_resolved_entity_name() -> None:
+    si = SearchItem(initial_info=LFMRec("Some+Artist", "Some+Track", EntityType.TRACK, RecContext.SIMILAR_ARTIST))
+    with patch.object(LFMRec, "get_human_readable_track_str") as mock_track_fn:
+        assert si.track_name == "Some Track"
+        mock_track_fn.assert_not_called()
+
+
+def test_track_name_album_search_raises() -> None:
+    si = SearchItem(initial_info=LFMRec("Some+Artist", "Some+Album", EntityType.ALBUM, RecContext.SIMILAR_ARTIST))
+    with pytest.raises(LFMRecException):
+        si.track_name
+
+
+def test_search_item_uses_slots() -> None:
+    si = SearchItem(initial_info=AdhocSearch(artist="Some Artist", release="Some Album"))
+    assert not hasattr(si, "__dict__")
+    with pytest.raises(AttributeError):
+        si.not_a_field = True  # type: ignore[attr-defined]
+
+
+def test_encoded_release_name() -> None:
+    si = SearchItem(initial_info=AdhocSearch(artist="Some Artist", track="Some Track"))
+    si.release_name = "First Release"
+    assert si.encoded_release_name == "First+Release"
+    assert si.encoded_release_name == "First+Release"
+    si.release_name = "Other Release"
+    assert si.encoded_release_name == "Other+Release", "Expected re-encoding after release_name changes"
@@ -40,7 +40,7 @@ def test_filter_process(
     )
     mock_skip_reason = SkipReason.NO_MATCH_FOUND
     func_ret_val = None if processable else mock_skip_reason
-    mock_filter_funcs: FilterFuncs = tuple([lambda si, state: func_ret_val for _ in range(len(filter_class.funcs))])
+    mock_filter_funcs: FilterFuncs = tuple([lambda state, si: func_ret_val for _ in range(len(filter_class.funcs))])
     with (
         patch.object(filter_class, "funcs", new_callable=PropertyMock) as mock_funcs_property,
         patch.object(filter_class, "_mark_skipped", return_value=None) as mock_mark_skipped,
@@ -87,3 +87,11 @@ def test_mark_skipped_logs_real_filter_classname(
             PostRedSearchFilter._mark_skipped(si=mock_si, skip_reason=SkipReason.NO_MATCH_FOUND)
     assert "filtered by PostRedSearchFilter" in caplog.text
     assert "ABCMeta" not in caplog.text
+
+
+def test_pre_mbid_resolution_filter_rule_order() -> None:
+    """The cheap rec-context rule should short-circuit ahead of the snatch-history lookup."""
+    assert PreMBIDResolutionFilter.funcs == (
+        SearchState._pre_mbid_reso_rule_allowed_rec_context,
+        SearchState._pre_mbid_reso_rule_not_previously_snatched,
+    )
@@ -7,14 +7,14 @@ from unittest.mock import MagicMock, PropertyMock, patch
 import pytest
 from sqlmodel import Session
 
-from plastered.config.app_settings import AppSettings, FormatPreference, get_app_settings
+from plastered.config.app_settings import AppSettings, FormatPreference, RedSearchOverrides, get_app_settings
 from plastered.db.db_models import SearchRecord, Status, SkipReason
 from plastered.models.adhoc_search_models import AdhocSearch
 from plastered.models.lfm_models import LFMAlbumInfo
 from plastered.models.red_models import CdOnlyExtras, RedFormat, ReleaseEntry, TorrentEntry
 from plastered.models.search_item import SearchItem
 from plastered.models.types import RedReleaseType
-from plastered.release_search.search_helpers import SearchState, _required_search_kwargs
+from plastered.release_search.search_helpers import SearchState
 from plastered.models.lfm_models import LFMRec
 from plastered.models.types import RecContext as rc
 from plastered.models.types import EntityType as rt
@@ -213,6 +213,11 @@ def _make_te(fmt: str, encoding: str, media: str, size_gb: float, tid: int = 1)
     )
 
 
+def _without_red_format(te: TorrentEntry) -> TorrentEntry:
+    te.red_format = None
+    return te
+
+
 def _release_entry(torrent_entries: list[TorrentEntry]) -> ReleaseEntry:
     return ReleaseEntry(
         group_id=69, media="CD", release_type=RedReleaseType.ALBUM, torrent_entries=torrent_entries, remastered=False
@@ -285,6 +290,31 @@ _FLAC_24_SACD = FormatPreference(format=fe.FLAC, encoding=ee.TWO_FOUR_BIT_LOSSLE
             False,
             id="prefers-size-acceptable-within-pref",
         ),
+        # A repeated preference keeps its highest priority.
+        pytest.param(
+            [_FLAC_24_WEB, _FLAC_LL_CD, _FLAC_24_WEB],
+            lambda: [
+                _release_entry(
+                    [
+                        _make_te("FLAC", "Lossless", "CD", 10.0, tid=8),
+                        _make_te("FLAC", "24bit Lossless", "WEB", 5.0, tid=9),
+                    ]
+                )
+            ],
+            50.0,
+            9,
+            False,
+            id="repeated-pref-keeps-highest-priority",
+        ),
+        # Torrents without a parsed format are ignored.
+        pytest.param(
+            [_FLAC_24_WEB],
+            lambda: [_release_entry([_without_red_format(_make_te("FLAC", "24bit Lossless", "WEB", 5.0, tid=10))])],
+            50.0,
+            None,
+            False,
+            id="no-red-format",
+        ),
         # No browse results at all.
         pytest.param([_FLAC_24_WEB], list, 50.0, None, False, id="empty-results"),
     ],
@@ -297,8 +327,9 @@ def test_select_best_torrent(
     expected_tid: int | None,
     expected_above_max: bool,
 ) -> None:
-    search_state = SearchState(app_settings=valid_app_settings)
-    search_state._red_format_preferences = prefs
+    search_state = SearchState(
+        app_settings=valid_app_settings.with_red_overrides(RedSearchOverrides(format_preferences=prefs))
+    )
     search_state._max_size_gb = max_size_gb
     match = search_state.select_best_torrent(release_entries=release_entries_factory())
     if expected_tid is None:
@@ -335,10 +366,8 @@ def test_pre_search_rule_skip_prior_snatch(
 ) -> None:
     si = SearchItem(initial_info=LFMRec("a", "e", rt.ALBUM, rc.SIMILAR_ARTIST))
     search_state = SearchState(app_settings=valid_app_settings)
-    search_state._red_user_details = MagicMock(
-        name="_red_user_details.has_snatched_release", create=True, return_value=mock_has_snatched_release
-    )
-    search_state._red_user_details.has_snatched_release.return_value = mock_has_snatched_release
+    search_state._red_user_details = MagicMock(spec=RedUserDetails)
+    search_state._snatched_release_pairs = frozenset({("a", "e")}) if mock_has_snatched_release else frozenset()
     search_state._skip_prior_snatches = skip_prior_snatches
     actual = search_state._pre_mbid_reso_rule_not_previously_snatched(si=si)
     assert actual == expected
@@ -352,15 +381,13 @@ def test_pre_search_rule_skip_prior_snatch_uses_resolved_release_name(valid_app_
     si = SearchItem(initial_info=AdhocSearch(artist="Queen", track="Bohemian Rhapsody"))
     si.release_name = "A Night at the Opera"  # as set by track resolution earlier in the chain
     search_state = SearchState(app_settings=valid_app_settings)
-    search_state._red_user_details = MagicMock()
-    search_state._red_user_details.has_snatched_release.return_value = False
+    search_state._red_user_details = MagicMock(spec=RedUserDetails)
+    search_state._snatched_release_pairs = frozenset({("queen", "a night at the opera")})
     search_state._skip_prior_snatches = True
 
-    search_state._pre_mbid_reso_rule_not_previously_snatched(si=si)
+    actual = search_state._pre_mbid_reso_rule_not_previously_snatched(si=si)
 
-    search_state._red_user_details.has_snatched_release.assert_called_once_with(
-        artist="Queen", release="A Night at the Opera"
-    )
+    assert actual == SkipReason.ALREADY_SNATCHED
 
 
 def test_pre_search_rule_skip_prior_snatch_user_details_not_initialized(valid_app_settings: AppSettings) -> None:
@@ -391,9 +418,27 @@ def test_set_search_state_red_user_details(
         search_state.set_red_user_details(red_user_details=no_snatch_user_details)
         assert search_state._max_download_allowed_gb == expected_max_dl
         assert search_state._red_user_details is no_snatch_user_details
+        assert search_state._snatched_release_pairs == frozenset()
+        assert search_state._snatched_tids == frozenset()
         rud_calc_method.assert_called_once_with(min_allowed_ratio=valid_app_settings.red.snatches.min_allowed_ratio)
 
 
+@pytest.mark.parametrize("skip_prior_snatches", [False, True])
+@pytest.mark.parametrize("via_init", [False, True])
+def test_snatched_release_pairs_snapshot_only_when_rule_enabled(
+    valid_app_settings: AppSettings, mock_red_user_details: RedUserDetails, skip_prior_snatches: bool, via_init: bool
+) -> None:
+    app_settings = valid_app_settings.with_red_overrides(RedSearchOverrides(skip_prior_snatches=skip_prior_snatches))
+    if via_init:
+        search_state = SearchState(app_settings=app_settings, red_user_details=mock_red_user_details)
+    else:
+        search_state = SearchState(app_settings=app_settings)
+        search_state.set_red_user_details(red_user_details=mock_red_user_details)
+    expected = mock_red_user_details.snatched_release_pairs() if skip_prior_snatches else frozenset()
+    assert search_state._snatched_release_pairs == expected
+    assert search_state._snatched_tids == mock_red_user_details.snatched_tids()
+
+
 @pytest.mark.parametrize(
     "require_mbid_resolution, has_required_fields, expected",
     [
@@ -437,6 +482,16 @@ def test_post_red_search_rule_found_match_with_allowed_size(
         mock_si_method.assert_called_once()
 
 
+def test_post_red_search_rule_no_match_logs_at_info(
+    valid_app_settings: AppSettings, caplog: pytest.LogCaptureFixture
+) -> None:
+    search_state = SearchState(app_settings=valid_app_settings)
+    si = SearchItem(initial_info=LFMRec("Some+Artist", "Some+Album", rt.ALBUM, rc.SIMILAR_ARTIST))
+    with caplog.at_level("INFO", logger="plastered.release_search.search_helpers"):
+        search_state.post_red_search_rule_found_match_with_allowed_size(si=si)
+    assert "No valid RED match found for album: 'Some Album' by 'Some Artist'" in caplog.text
+
+
 @pytest.mark.parametrize(
     "allow_library_items, rec_context, expected",
     [
@@ -456,46 +511,39 @@ def test_pre_search_rule_skip_library_items(
     assert actual == expected
 
 
-@pytest.mark.parametrize(
-    "mock_tids_to_snatch, mock_pre_snatched, expected",
-    [([], False, None), ([69], False, SkipReason.DUPE_OF_ANOTHER_REC), ([], True, SkipReason.ALREADY_SNATCHED)],
-)
-def test_post_search_rule_dupe_snatch(
+@pytest.mark.parametrize("mock_pre_snatched, expected", [(False, None), (True, SkipReason.ALREADY_SNATCHED)])
+def test_post_search_rule_prior_snatch(
     valid_app_settings: AppSettings,
     mock_torrent_entry: TorrentEntry,
     no_snatch_user_details: RedUserDetails,
-    mock_tids_to_snatch: set[int],
     mock_pre_snatched: bool,
     expected: SkipReason | None,
 ) -> None:
-    with patch.object(RedUserDetails, "has_snatched_tid", return_value=mock_pre_snatched) as mock_rud_has_snatched:
-        si = SearchItem(initial_info=LFMRec("a", "e", rt.ALBUM, rc.SIMILAR_ARTIST))
-        si.torrent_entry = mock_torrent_entry
-        search_state = SearchState(app_settings=valid_app_settings)
-        search_state._tids_to_snatch = mock_tids_to_snatch
-        search_state._red_user_details = no_snatch_user_details
-        actual = search_state._post_red_search_rule_not_dupe_snatch(si=si)
-        assert actual == expected
-        if expected == SkipReason.ALREADY_SNATCHED:
-            mock_rud_has_snatched.assert_called_once()
+    si = SearchItem(initial_info=LFMRec("a", "e", rt.ALBUM, rc.SIMILAR_ARTIST))
+    si.torrent_entry = mock_torrent_entry
+    search_state = SearchState(app_settings=valid_app_settings)
+    search_state._red_user_details = no_snatch_user_details
+    search_state._snatched_tids = frozenset([mock_torrent_entry.torrent_id]) if mock_pre_snatched else frozenset()
+    actual = search_state._post_red_search_rule_not_prior_snatch(si=si)
+    assert actual == expected
 
 
-def test_post_search_rule_dupe_snatch_user_details_not_initialized(valid_app_settings: AppSettings) -> None:
+def test_post_search_rule_prior_snatch_user_details_not_initialized(valid_app_settings: AppSettings) -> None:
     si = SearchItem(initial_info=LFMRec("a", "e", rt.ALBUM, rc.SIMILAR_ARTIST))
     search_state = SearchState(app_settings=valid_app_settings)
     search_state._red_user_details = None
     with pytest.raises(SearchStateException, match=re.escape("Red user details not initialized")):
-        _ = search_state._post_red_search_rule_not_dupe_snatch(si=si)
+        _ = search_state._post_red_search_rule_not_prior_snatch(si=si)
 
 
-def test_post_search_rule_dupe_snatch_no_torrent_entry(
+def test_post_search_rule_prior_snatch_no_torrent_entry(
     valid_app_settings: AppSettings, no_snatch_user_details: RedUserDetails
 ) -> None:
     si = SearchItem(initial_info=LFMRec("a", "e", rt.ALBUM, rc.SIMILAR_ARTIST), torrent_entry=None)
     search_state = SearchState(app_settings=valid_app_settings)
     search_state._red_user_details = no_snatch_user_details
     with pytest.raises(SearchItemException, match=re.escape("SearchItem instance has not torrent_entry")):
-        _ = search_state._post_red_search_rule_not_dupe_snatch(si=si)
+        _ = search_state._post_red_search_rule_not_prior_snatch(si=si)
 
 
 @pytest.mark.parametrize("mock_exc_name", [None, "FakeException"])
@@ -531,11 +579,25 @@ def test_add_search_item_to_snatch(valid_app_settings: AppSettings, mock_torrent
         "Expect initial search state to have 0 items in to_snatch list"
     )
     assert len(search_state._tids_to_snatch) == 0, "Expect initial search state to have 0 items in _tids_to_snatch"
-    search_state.add_search_item_to_snatch(si=si)
+    assert search_state.add_search_item_to_snatch(si=si) is None
     assert search_state._search_items_to_snatch == [si]
     assert search_state._tids_to_snatch == set([si.torrent_entry.torrent_id])  # type: ignore[union-attr]
 
 
+def test_add_search_item_to_snatch_dupe_of_another_rec(
+    valid_app_settings: AppSettings, mock_torrent_entry: TorrentEntry
+) -> None:
+    first, second = (
+        SearchItem(initial_info=LFMRec(artist, "e", rt.ALBUM, rc.SIMILAR_ARTIST), torrent_entry=mock_torrent_entry)
+        for artist in ("a", "b")
+    )
+    search_state = SearchState(app_settings=valid_app_settings)
+    assert search_state.add_search_item_to_snatch(si=first) is None
+    assert search_state.add_search_item_to_snatch(si=second) == SkipReason.DUPE_OF_ANOTHER_REC
+    assert search_state._search_items_to_snatch == [first]
+    assert search_state._tids_to_snatch == {mock_torrent_entry.torrent_id}
+
+
 def test_get_search_items_to_snatch_hit_size_limit(
     valid_app_settings: AppSettings, mock_torrent_entry: TorrentEntry
 ) -> None:
@@ -546,17 +608,57 @@ def test_get_search_items_to_snatch_hit_size_limit(
             torrent_entry=mock_torrent_entry,
         )
     ]
-    with patch.object(SearchState, "_add_skipped_snatch_row") as mock_add_skipped_snatch_row_fn:
+    with patch.object(SearchState, "_add_skipped_snatch_rows") as mock_add_skipped_snatch_rows_fn:
         search_state = SearchState(app_settings=valid_app_settings)
         search_state._max_download_allowed_gb = mock_torrent_entry.get_size("GB") / 2.0
         search_state._search_items_to_snatch = mock_items_to_snatch
         actual = search_state.get_search_items_to_snatch()
         assert actual == []
-        mock_add_skipped_snatch_row_fn.assert_called_once_with(
-            si=mock_items_to_snatch[0], reason=SkipReason.MIN_RATIO_LIMIT
+        mock_add_skipped_snatch_rows_fn.assert_called_once_with(
+            sis=[mock_items_to_snatch[0]], reason=SkipReason.MIN_RATIO_LIMIT
         )
 
 
+@pytest.mark.parametrize(
+    "sizes_gb, max_allowed_gb, expected_snatched_gb, expected_skipped_gb",
+    [
+        pytest.param([1.0, 2.0, 3.0], 10.0, [3.0, 2.0, 1.0], [], id="all-fit"),
+        pytest.param([5.0, 4.0, 3.0], 8.0, [5.0, 3.0], [4.0], id="smaller-item-fits-after-cutoff"),
+        pytest.param([5.0, 4.0, 3.0], 9.0, [5.0, 4.0], [3.0], id="exact-limit-prefix"),
+        pytest.param([5.0, 4.0], 3.0, [], [5.0, 4.0], id="none-fit"),
+        pytest.param([1.0, 6.0, 2.0, 6.0, 3.0], 7.0, [6.0, 1.0], [6.0, 3.0, 2.0], id="greedy-with-ties"),
+        pytest.param([6.0, 5.0, 4.0, 2.0], 7.0, [6.0], [5.0, 4.0, 2.0], id="only-largest-fits"),
+        pytest.param([], 7.0, [], [], id="empty"),
+    ],
+)
+def test_get_search_items_to_snatch_greedy_selection(
+    valid_app_settings: AppSettings,
+    mock_torrent_entry: TorrentEntry,
+    sizes_gb: list[float],
+    max_allowed_gb: float,
+    expected_snatched_gb: list[float],
+    expected_skipped_gb: list[float],
+) -> None:
+    search_items = []
+    for size_gb in sizes_gb:
+        te = deepcopy(mock_torrent_entry)
+        te.size = size_gb * 1e9
+        search_items.append(SearchItem(initial_info=LFMRec("a", "e", rt.ALBUM, rc.SIMILAR_ARTIST), torrent_entry=te))
+    with patch.object(SearchState, "_add_skipped_snatch_rows") as mock_add_skipped_snatch_rows_fn:
+        search_state = SearchState(app_settings=valid_app_settings)
+        search_state._max_download_allowed_gb = max_allowed_gb
+        search_state._search_items_to_snatch = search_items
+        actual = search_state.get_search_items_to_snatch()
+        assert [si.size_gb for si in actual] == expected_snatched_gb
+        if not expected_skipped_gb:
+            mock_add_skipped_snatch_rows_fn.assert_not_called()
+        else:
+            # All skips are recorded in one batch, in the same largest-first order they were considered in.
+            mock_add_skipped_snatch_rows_fn.assert_called_once()
+            skipped = mock_add_skipped_snatch_rows_fn.call_args.kwargs["sis"]
+            assert [si.size_gb for si in skipped] == expected_skipped_gb
+
+
 def test_get_search_items_to_snatch_manual_run(valid_app_settings: AppSettings) -> None:
     search_state = SearchState(app_settings=valid_app_settings)
     mock_si = SearchItem(initial_info=AdhocSearch(artist="fake", release="faker"))
@@ -593,16 +695,30 @@ def test_te_size_acceptable(
     max_size: float,
     expected: float,
 ) -> None:
-    with patch.object(SearchState, "_add_skipped_snatch_row") as mock_add_skipped_snatch_row_fn:
-        ss = SearchState(app_settings=valid_app_settings)
-        si = SearchItem(initial_info=LFMRec("a", "e", rt.ALBUM, rc.SIMILAR_ARTIST))
-        mock_torrent_entry.size = te_size * 1e9
-        si.torrent_entry = mock_torrent_entry
-        ss._max_download_allowed_gb = max_size
-        actual = ss._te_size_acceptable(cumulative_dl_size_gb=cum_size, si=si)
-        assert actual == expected
-        if expected < 0:
-            mock_add_skipped_snatch_row_fn.assert_called_once_with(si=si, reason=SkipReason.MIN_RATIO_LIMIT)
+    ss = SearchState(app_settings=valid_app_settings)
+    si = SearchItem(initial_info=LFMRec("a", "e", rt.ALBUM, rc.SIMILAR_ARTIST))
+    mock_torrent_entry.size = te_size * 1e9
+    si.torrent_entry = mock_torrent_entry
+    ss._max_download_allowed_gb = max_size
+    actual = ss._te_size_acceptable(cumulative_dl_size_gb=cum_size, si=si, te_size_gb=si.size_gb)
+    assert actual == expected
+
+
+@pytest.mark.parametrize("debug_enabled", [False, True])
+def test_add_skipped_snatch_rows(valid_app_settings: AppSettings, debug_enabled: bool) -> None:
+    sis = [
+        SearchItem(initial_info=LFMRec("a", e, rt.ALBUM, rc.SIMILAR_ARTIST), search_id=i) for i, e in enumerate("xy")
+    ]
+    with (
+        patch("plastered.release_search.search_helpers.set_result_statuses") as mock_set_result_statuses,
+        patch("plastered.release_search.search_helpers._LOGGER.isEnabledFor", return_value=debug_enabled),
+    ):
+        SearchState(app_settings=valid_app_settings)._add_skipped_snatch_rows(
+            sis=sis, reason=SkipReason.MIN_RATIO_LIMIT
+        )
+    mock_set_result_statuses.assert_called_once_with(
+        search_ids=[0, 1], status=Status.SKIPPED, status_model_kwargs={"skip_reason": SkipReason.MIN_RATIO_LIMIT}
+    )
 
 
 @pytest.mark.parametrize(
@@ -628,19 +744,26 @@ def test_te_size_acceptable(
     ],
 )
 def test_required_search_kwargs(
+    valid_app_settings: AppSettings,
     use_release_type: bool,
     use_first_release_year: bool,
     use_record_label: bool,
     use_catalog_number: bool,
     expected: set[str],
 ) -> None:
-    actual = _required_search_kwargs(
-        use_release_type=use_release_type,
-        use_first_release_year=use_first_release_year,
-        use_record_label=use_record_label,
-        use_catalog_number=use_catalog_number,
+    app_settings = valid_app_settings.with_red_overrides(
+        RedSearchOverrides(
+            use_release_type=use_release_type,
+            use_first_release_year=use_first_release_year,
+            use_record_label=use_record_label,
+            use_catalog_number=use_catalog_number,
+        )
     )
+    search_state = SearchState(app_settings=app_settings)
+    actual = search_state._required_red_search_kwargs
+    assert isinstance(actual, frozenset)
     assert actual == expected
+    assert search_state._require_mbid_resolution is bool(expected)
 
 
 @pytest.mark.parametrize(
@@ -649,6 +772,7 @@ def test_required_search_kwargs(
         ({}, set(), True),
         ({RED_PARAM_RELEASE_TYPE: "track"}, set(), True),
         ({}, {RED_PARAM_RELEASE_TYPE}, False),
+        ({RED_PARAM_RELEASE_TYPE: None}, {RED_PARAM_RELEASE_TYPE}, False),
         ({RED_PARAM_RELEASE_TYPE: "track"}, {RED_PARAM_RELEASE_TYPE}, True),
         ({RED_PARAM_RELEASE_TYPE: "track"}, {RED_PARAM_RECORD_LABEL}, False),
         ({RED_PARAM_RELEASE_TYPE: "track"}, {RED_PARAM_RELEASE_TYPE, RED_PARAM_RECORD_LABEL}, False),
@@ -666,7 +790,7 @@ def test_search_kwargs_has_all_required_fields(
         initial_info=LFMRec("artist", "Title", rt.ALBUM, rc.SIMILAR_ARTIST),
         _search_kwargs=mock_search_kwargs,  # type: ignore[arg-type]
     )
-    actual = test_si.search_kwargs_has_all_required_fields(required_kwargs=required_kwargs)
+    actual = test_si.search_kwargs_has_all_required_fields(required_kwargs=frozenset(required_kwargs))
     assert actual == expected
 
 
@@ -706,11 +830,11 @@ def test_search_item_found_red_match(
     "mock_rec_type, mock_lfmti, expected_get_human_readable_entity_str_call_cnt, expected_result",
     [
         pytest.param(rt.ALBUM, None, 1, "Title", id="album rec"),
-        pytest.param(rt.TRACK, None, 0, "None", id="track-no-lfmti"),
+        pytest.param(rt.TRACK, None, 1, "None", id="track-no-lfmti"),
         pytest.param(
             rt.TRACK,
             LFMTrackInfo(artist="a", track_name="t", release_name="Title", lfm_url="fake", release_mbid="abc"),
-            0,
+            1,
             "Title",
             id="track-with-lfmti",
         ),
@@ -798,8 +922,31 @@ def test_record_matched_result_rows_writes_one_per_matched_item(valid_app_settin
         si.torrent_entry = mock_te
         si.search_id = tid
         state._search_items_to_snatch.append(si)
-    with patch("plastered.release_search.search_helpers.set_result_status") as mock_set_result_status:
+    no_match_si = SearchItem(initial_info=LFMRec("a", "e", rt.ALBUM, rc.SIMILAR_ARTIST))
+    state._search_items_to_snatch.append(no_match_si)
+    with patch("plastered.release_search.search_helpers.set_result_status_rows") as mock_set_result_status_rows:
+        state.record_matched_result_rows()
+    mock_set_result_status_rows.assert_called_once()
+    assert mock_set_result_status_rows.call_args.kwargs["status"] == Status.MATCHED
+    rows = mock_set_result_status_rows.call_args.kwargs["rows"]
+    assert [search_id for search_id, _ in rows] == [10, 20, 30]
+    assert [row_kwargs["tid"] for _, row_kwargs in rows] == [10, 20, 30]
+
+
+def test_record_matched_result_rows_noop_when_no_matches(valid_app_settings: AppSettings) -> None:
+    state = SearchState(app_settings=valid_app_settings)
+    with patch("plastered.release_search.search_helpers.set_result_status_rows") as mock_set_result_status_rows:
         state.record_matched_result_rows()
-    assert mock_set_result_status.call_count == 3
-    assert {call.kwargs["status_model_kwargs"]["tid"] for call in mock_set_result_status.call_args_list} == {10, 20, 30}
-    assert all(call.kwargs["status"] == Status.MATCHED for call in mock_set_result_status.call_args_list)
+    mock_set_result_status_rows.assert_not_called()
+
+
+@pytest.mark.parametrize("has_torrent_entry", [False, True])
+def test_matched_release_fields(mock_torrent_entry: TorrentEntry, has_torrent_entry: bool) -> None:
+    si = SearchItem(initial_info=LFMRec("a", "e", rt.ALBUM, rc.SIMILAR_ARTIST))
+    te = mock_torrent_entry if has_torrent_entry else None
+    with patch.object(SearchItem, "get_matched_mbid", return_value="some-mbid"):
+        actual = SearchState._matched_release_fields(si=si, te=te)
+    assert actual == {
+        "red_permalink": mock_torrent_entry.get_permalink_url() if has_torrent_entry else None,
+        "matched_mbid": "some-mbid",
+    }
@@ -161,6 +161,10 @@ def test_run_cache_load_data_if_valid(
             run_cache = RunCache(app_settings=valid_app_settings, cache_type=cache_type)
             actual = run_cache.load_data_if_valid(cache_key=cache_key, data_validator_fn=data_validator_fn)
             assert actual == expected, f"Expected {expected}, but got {actual}"
+            if cache_key == "will-raise-exception":
+                mock_diskcache.delete.assert_called_once_with(cache_key, retry=True)
+            else:
+                mock_diskcache.delete.assert_not_called()
 
 
 @pytest.mark.parametrize(
@@ -178,6 +182,18 @@ def test_run_cache_load_data_if_valid(
             datetime.strptime("2025-10-31 23:00:00", _DT_STR_FORMAT),
             3600,
         ),
+        (  # Expiry more than a day out (i.e. the cache was created within 20 minutes of midnight).
+            CACHE_TYPE_SCRAPER,
+            datetime.strptime("2025-11-02 00:00:00", _DT_STR_FORMAT),
+            datetime.strptime("2025-10-31 23:00:00", _DT_STR_FORMAT),
+            90000,
+        ),
+        (  # Already past the expiry.
+            CACHE_TYPE_SCRAPER,
+            datetime.strptime("2025-11-01 00:00:00", _DT_STR_FORMAT),
+            datetime.strptime("2025-11-01 00:00:10", _DT_STR_FORMAT),
+            0,
+        ),
     ],
 )
 def test_seconds_to_expiry(
@@ -193,14 +209,11 @@ def test_seconds_to_expiry(
             mock_diskcache_constructor.return_value = mock_diskcache
             mock_diskcache.stats.return_value = None
             mock_diskcache.expire.return_value = None
-            # https://docs.python.org/3/library/unittest.mock-examples.html#partial-mocking
-            with patch("plastered.run_cache.run_cache.datetime", wraps=datetime) as mock_datetime:
-                mock_datetime.now.return_value = fake_now_datetime
-                mock_datetime.side_effect = lambda *args, **kw: datetime(*args, **kw)
+            with patch("plastered.run_cache.run_cache._tomorrow_midnight_datetime", return_value=expire_datetime):
                 run_cache = RunCache(app_settings=valid_app_settings, cache_type=cache_type)
-                run_cache._expiration_datetime = expire_datetime
+            with patch("plastered.run_cache.run_cache.time.time", return_value=fake_now_datetime.timestamp()):
                 actual = run_cache._seconds_to_expiry()
-                assert actual == expected_seconds, f"Expected {expected_seconds}, but got {actual}"
+            assert actual == expected_seconds, f"Expected {expected_seconds}, but got {actual}"
 
 
 @pytest.mark.parametrize("cache_type, test_key, test_data", [(CACHE_TYPE_SCRAPER, "my-fake-key", "my-fake-value")])
@@ -1,3 +1,4 @@
+import pickle
 from typing import Any
 
 import pytest
@@ -192,3 +193,53 @@ def test_lfmrec_is_track_rec(lfm_rec: LFMRec, expected: bool) -> None:
 def test_lfm_entity_url(lfm_rec: LFMRec, expected: str) -> None:
     actual = lfm_rec.lfm_entity_url
     assert actual == expected, f"Expected {lfm_rec}.lfm_entity_url to be '{expected}', but got '{actual}'"
+
+
+@pytest.mark.parametrize("recommendation_type", ["album", EntityType.ALBUM])
+@pytest.mark.parametrize("rec_context", ["in-library", RecContext.IN_LIBRARY])
+def test_lfmrec_stores_enum_members(recommendation_type: str | EntityType, rec_context: str | RecContext) -> None:
+    """Raw string values are normalized to the enum members at construction, so identity comparisons hold."""
+    rec = LFMRec(
+        lfm_artist_str="Artist",
+        lfm_entity_str="Album",
+        recommendation_type=recommendation_type,
+        rec_context=rec_context,
+    )
+    assert rec.entity_type is EntityType.ALBUM
+    assert rec.rec_context is RecContext.IN_LIBRARY
+    assert rec.is_album_rec()
+
+
+@pytest.mark.parametrize("recommendation_type", [EntityType.ALBUM, EntityType.TRACK])
+def test_lfmrec_pickle_round_trip(recommendation_type: EntityType) -> None:
+    rec = LFMRec(
+        lfm_artist_str="Some+Artist",
+        lfm_entity_str="Some+Entity",
+        recommendation_type=recommendation_type,
+        rec_context=RecContext.SIMILAR_ARTIST,
+    )
+    assert rec.__reduce__() == (LFMRec, ("Some+Artist", "Some+Entity", recommendation_type, RecContext.SIMILAR_ARTIST))
+    unpickled = pickle.loads(pickle.dumps([rec, rec], protocol=pickle.HIGHEST_PROTOCOL))
+    assert unpickled == [rec, rec]
+    assert unpickled[0].entity_type is recommendation_type
+    assert unpickled[0].rec_context is RecContext.SIMILAR_ARTIST
+
+
+def test_lfmrec_uses_slots() -> None:
+    rec = LFMRec("Some+Artist", "Some+Album", EntityType.ALBUM, RecContext.SIMILAR_ARTIST)
+    assert not hasattr(rec, "__dict__")
+    with pytest.raises(AttributeError):
+        rec.not_a_field = True  # type: ignore[attr-defined]
+
+
+def test_lfmrec_setstate_restores_legacy_dict_state() -> None:
+    rec = LFMRec.__new__(LFMRec)
+    rec.__setstate__(
+        {
+            "_lfm_artist_str": "Some+Artist",
+            "_lfm_entity_str": "Some+Album",
+            "_entity_type": EntityType.ALBUM,
+            "_rec_context": RecContext.IN_LIBRARY,
+        }
+    )
+    assert rec == LFMRec("Some+Artist", "Some+Album", EntityType.ALBUM, RecContext.IN_LIBRARY)
@@ -12,6 +12,8 @@ from plastered.run_cache.run_cache import RunCache
 from plastered.scraper.lfm_scraper import (
     _CONTENT_READ_MAX_ATTEMPTS,
     _PAGE_SETTLE_TIMEOUT_MS,
+    _RECS_PAGE_CONFIGS,
+    _block_unneeded_resources,
     LFMRecsScraper,
     _sleep_random,
     cached_lfm_recs_validator,
@@ -23,11 +25,14 @@ from plastered.utils.constants import (
     LOGIN_URL,
     LOGIN_USERNAME_FORM_LOCATOR,
     LOGOUT_URL,
+    PAGE_LOAD_JITTER_SEC_MAX,
+    PAGE_LOAD_JITTER_SEC_MIN,
     PW_USER_AGENT,
     RENDER_WAIT_SEC_MAX,
     RENDER_WAIT_SEC_MIN,
     TRACK_RECS_BASE_URL,
 )
+from plastered.utils.exceptions import ScraperException
 
 
 @pytest.fixture(scope="function")
@@ -298,13 +303,26 @@ def test_sleep_random() -> None:
     assert RENDER_WAIT_SEC_MAX < 10, (
         f"Expected constant 'RENDER_WAIT_SEC_MAX' to be less than 10, but found it set to {RENDER_WAIT_SEC_MAX}"
     )
-    with patch("plastered.scraper.lfm_scraper.randint") as mock_randint:
-        mock_randint.return_value = 5
+    with patch("plastered.scraper.lfm_scraper.uniform") as mock_uniform:
+        mock_uniform.return_value = 5.25
         with patch("plastered.scraper.lfm_scraper.sleep") as mock_sleep:
             mock_sleep.return_value = None
             _sleep_random()
-            mock_randint.assert_called_once_with(RENDER_WAIT_SEC_MIN, RENDER_WAIT_SEC_MAX)
-            mock_sleep.assert_called_once_with(mock_randint.return_value)
+            mock_uniform.assert_called_once_with(RENDER_WAIT_SEC_MIN, RENDER_WAIT_SEC_MAX)
+            mock_sleep.assert_called_once_with(mock_uniform.return_value)
+
+
+def test_sleep_random_page_load_jitter_bounds() -> None:
+    assert 0 < PAGE_LOAD_JITTER_SEC_MIN < PAGE_LOAD_JITTER_SEC_MAX <= RENDER_WAIT_SEC_MIN, (
+        "Expected the page-load jitter bounds to be positive, ordered, and no longer than the login-flow wait, but found "
+        f"{PAGE_LOAD_JITTER_SEC_MIN} vs. {PAGE_LOAD_JITTER_SEC_MAX}"
+    )
+    with patch("plastered.scraper.lfm_scraper.uniform") as mock_uniform:
+        mock_uniform.return_value = 1.5
+        with patch("plastered.scraper.lfm_scraper.sleep") as mock_sleep:
+            _sleep_random(min_seconds=PAGE_LOAD_JITTER_SEC_MIN, max_seconds=PAGE_LOAD_JITTER_SEC_MAX)
+            mock_uniform.assert_called_once_with(PAGE_LOAD_JITTER_SEC_MIN, PAGE_LOAD_JITTER_SEC_MAX)
+            mock_sleep.assert_called_once_with(mock_uniform.return_value)
 
 
 @pytest.mark.parametrize(
@@ -395,12 +413,37 @@ def test_scraper_enter_no_cache(lfm_rec_scraper: LFMRecsScraper) -> None:
             mock_sync_playwright_ctx.assert_has_calls([call()])
             mock_playwright.assert_has_calls([call.chromium.launch(headless=True)])
             mock_browser.new_page.assert_called_once_with(user_agent=PW_USER_AGENT)
+            mock_browser.new_page.return_value.route.assert_called_once_with("**/*", _block_unneeded_resources)
             assert lfm_rec_scraper._playwright is not None
             assert lfm_rec_scraper._browser is not None
             assert lfm_rec_scraper._page is not None
             user_login_mock.assert_called_once()
 
 
+@pytest.mark.parametrize(
+    "resource_type, should_abort",
+    [
+        ("document", False),
+        ("script", False),
+        ("stylesheet", False),
+        ("xhr", False),
+        ("image", True),
+        ("font", True),
+        ("media", True),
+    ],
+)
+def test_block_unneeded_resources(resource_type: str, should_abort: bool) -> None:
+    mock_route = MagicMock()
+    mock_route.request.resource_type = resource_type
+    _block_unneeded_resources(route=mock_route)
+    if should_abort:
+        mock_route.abort.assert_called_once()
+        mock_route.continue_.assert_not_called()
+    else:
+        mock_route.continue_.assert_called_once()
+        mock_route.abort.assert_not_called()
+
+
 def test_scraper_enter_with_cache(lfm_rec_scraper: LFMRecsScraper) -> None:
     mock_playwright = MagicMock()
     mock_browser = MagicMock()
@@ -551,12 +594,14 @@ def test_navigate_to_page_and_get_page_source(
     fake_url = "https://google.com"
     lfm_rec_scraper._page = MagicMock()
     with patch("plastered.scraper.lfm_scraper._sleep_random") as mock_sleep_random:
+        lfm_rec_scraper._page.attach_mock(mock_sleep_random, "sleep_random")
         lfm_rec_scraper._navigate_to_page_and_get_page_source(url=fake_url, rec_type=rec_type)
         lfm_rec_scraper._page.assert_has_calls(
             [
                 call.goto(fake_url, wait_until="domcontentloaded"),
                 call.locator(expected_css_selector),
                 call.locator().first.wait_for(),
+                call.sleep_random(min_seconds=PAGE_LOAD_JITTER_SEC_MIN, max_seconds=PAGE_LOAD_JITTER_SEC_MAX),
                 call.content(),
             ]
         )
@@ -656,3 +701,83 @@ def test_scrape_recs(
         mock_scrape_recs_list.return_value = []
         lfm_rec_scraper.scrape_recs()
         mock_scrape_recs_list.assert_has_calls(expected_scrape_recs_list_calls)
+
+
+def test_extract_recs_from_page_source_ignores_content_outside_rec_items(
+    album_recs_page_one_html: str, lfm_rec_scraper: LFMRecsScraper, expected_album_recs: list[LFMRec]
+) -> None:
+    decoy = '<h3 class="music-recommended-albums-item-name"><a class="link-block-target" href="/music/X/Y">Y</a></h3>'
+    actual = lfm_rec_scraper._extract_recs_from_page_source(
+        page_source=decoy + album_recs_page_one_html, rec_type=EntityType.ALBUM
+    )
+    assert actual == expected_album_recs
+
+
+def test_recs_page_configs_cover_every_rec_type() -> None:
+    assert set(_RECS_PAGE_CONFIGS) == set(EntityType)
+    assert _RECS_PAGE_CONFIGS[EntityType.ALBUM].base_url == ALBUM_RECS_BASE_URL
+    assert _RECS_PAGE_CONFIGS[EntityType.TRACK].base_url == TRACK_RECS_BASE_URL
+
+
+@pytest.mark.parametrize("cache_enabled", [False, True])
+def test_scrape_recs_list_cache_write(lfm_rec_scraper: LFMRecsScraper, cache_enabled: bool) -> None:
+    mock_run_cache = MagicMock()
+    mock_run_cache.enabled = cache_enabled
+    lfm_rec_scraper._run_cache = mock_run_cache
+    with (
+        patch.object(LFMRecsScraper, "_navigate_to_page_and_get_page_source", return_value=""),
+        patch.object(LFMRecsScraper, "_extract_recs_from_page_source", return_value=["album-rec"]),
+    ):
+        actual = lfm_rec_scraper._scrape_recs_list(rec_type=EntityType.ALBUM)
+    if cache_enabled:
+        mock_run_cache.write_data.assert_called_once_with(cache_key=EntityType.ALBUM.value, data=actual)
+    else:
+        mock_run_cache.write_data.assert_not_called()
+
+
+def test_scrape_recs_caches_each_rec_type_as_it_is_scraped(lfm_rec_scraper: LFMRecsScraper) -> None:
+    """A failure scraping a later rec type leaves the earlier rec types' recs in the run cache."""
+    lfm_rec_scraper._rec_types_to_scrape = [EntityType.ALBUM, EntityType.TRACK]
+    lfm_rec_scraper._max_rec_pages_to_scrape = 1
+    mock_run_cache = MagicMock()
+    mock_run_cache.enabled = True
+    lfm_rec_scraper._run_cache = mock_run_cache
+
+    def _fake_navigate(url: str, rec_type: EntityType) -> str:
+        if rec_type is EntityType.TRACK:
+            raise ScraperException("Timed out waiting for track recs")
+        return ""
+
+    with (
+        patch.object(LFMRecsScraper, "_navigate_to_page_and_get_page_source", side_effect=_fake_navigate),
+        patch.object(LFMRecsScraper, "_extract_recs_from_page_source", return_value=["album-rec"]),
+    ):
+        with pytest.raises(ScraperException, match="track recs"):
+            lfm_rec_scraper.scrape_recs()
+    mock_run_cache.write_data.assert_called_once_with(cache_key=EntityType.ALBUM.value, data=["album-rec"])
+
+
+def test_extract_recs_from_page_source_interns_artist(lfm_rec_scraper: LFMRecsScraper) -> None:
+    page_source = "".join(
+        '<li class="recommended-tracks-item-wrap"><h3 class="recommended-tracks-item-name">'
+        f'<a class="link-block-target" href="/music/Some+Artist/_/{track}">{track}</a></h3>'
+        '<p class="recommended-tracks-item-aux-text recommended-tracks-item-context">Similar to X</p></li>'
+        for track in ("Track+A", "Track+B")
+    )
+    first, second = lfm_rec_scraper._extract_recs_from_page_source(page_source=page_source, rec_type=EntityType.TRACK)
+    assert first.encoded_artist_str == "Some+Artist"
+    assert first.encoded_artist_str is second.encoded_artist_str
+
+
+def test_extract_recs_from_page_source_pairs_link_and_context_per_item(lfm_rec_scraper: LFMRecsScraper) -> None:
+    items = [
+        # No rec link: skipped, and must not shift the following rec onto this item's context.
+        '<p class="recommended-tracks-item-aux-text recommended-tracks-item-context">This artist is in your library</p>',
+        # Link that doesn't match the track href pattern: skipped.
+        '<h3 class="recommended-tracks-item-name"><a class="link-block-target" href="/music/Some+Artist">X</a></h3>',
+        # Valid rec with no context element: defaults to a similar-artist context.
+        '<h3 class="recommended-tracks-item-name"><a class="link-block-target" href="/music/A/_/B">B</a></h3>',
+    ]
+    page_source = "".join(f'<li class="recommended-tracks-item-wrap">{item}</li>' for item in items)
+    actual = lfm_rec_scraper._extract_recs_from_page_source(page_source=page_source, rec_type=EntityType.TRACK)
+    assert actual == [LFMRec("A", "B", EntityType.TRACK, RecContext.SIMILAR_ARTIST)]
@@ -1,4 +1,3 @@
-from collections import OrderedDict
 from typing import Any
 
 import pytest
@@ -104,44 +103,42 @@ def test_release_year_non_match(raw_field_present: bool, raw_field_value: str, e
             None,
             None,
             None,
-            OrderedDict([("releasetype", 1), ("year", None), ("recordlabel", None), ("cataloguenumber", None)]),
+            dict([("releasetype", 1), ("year", None), ("recordlabel", None), ("cataloguenumber", None)]),
         ),
         (
             "single",
             None,
             None,
             None,
-            OrderedDict([("releasetype", 9), ("year", None), ("recordlabel", None), ("cataloguenumber", None)]),
+            dict([("releasetype", 9), ("year", None), ("recordlabel", None), ("cataloguenumber", None)]),
         ),
         (
             "album",
             1969,
             None,
             None,
-            OrderedDict([("releasetype", 1), ("year", 1969), ("recordlabel", None), ("cataloguenumber", None)]),
+            dict([("releasetype", 1), ("year", 1969), ("recordlabel", None), ("cataloguenumber", None)]),
         ),
         (
             "album",
             None,
             "Fake Label",
             None,
-            OrderedDict([("releasetype", 1), ("year", None), ("recordlabel", "Fake+Label"), ("cataloguenumber", None)]),
+            dict([("releasetype", 1), ("year", None), ("recordlabel", "Fake+Label"), ("cataloguenumber", None)]),
         ),
         (
             "single",
             None,
             None,
             "DOODOO 89",
-            OrderedDict([("releasetype", 9), ("year", None), ("recordlabel", None), ("cataloguenumber", "DOODOO+89")]),
+            dict([("releasetype", 9), ("year", None), ("recordlabel", None), ("cataloguenumber", "DOODOO+89")]),
         ),
         (
             "album",
             1969,
             "Fake Label",
             "DOODOO 89",
-            OrderedDict(
-                [("releasetype", 1), ("year", 1969), ("recordlabel", "Fake+Label"), ("cataloguenumber", "DOODOO+89")]
-            ),
+            dict([("releasetype", 1), ("year", 1969), ("recordlabel", "Fake+Label"), ("cataloguenumber", "DOODOO+89")]),
         ),
     ],
 )
@@ -150,7 +147,7 @@ def test_get_release_searcher_kwargs(
     first_release_year: int | None,
     label: str | None,
     catalog_number: str | None,
-    expected: OrderedDict[str, Any],
+    expected: dict[str, Any],
 ) -> None:
     mbr = MBRelease(
         mbid="m",
@@ -164,7 +161,7 @@ def test_get_release_searcher_kwargs(
         catalog_number=catalog_number,
     )
     actual = mbr.get_release_searcher_kwargs()
-    assert isinstance(actual, OrderedDict)
+    assert type(actual) is dict
     assert len(actual) == len(expected)
     actual_keys = set(actual.keys())
     expected_keys = set(expected.keys())